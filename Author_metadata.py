@@ -1,11 +1,32 @@
 import os
-from openai import OpenAI
+import asyncio
+import functools
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from openai import OpenAI, AsyncOpenAI
 import openai
-import json
+import orjson
 from pydantic import BaseModel
 from typing import Optional
 from Markdownparser import MDParser
 
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_prompt(path: str) -> str:
+    """Reads a prompt file once per process."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+@functools.lru_cache(maxsize=8)
+def _get_openai_client(base_url: str, api_key: str) -> OpenAI:
+    """Returns one shared client per endpoint, so extractors reuse its pooled keep-alive connections."""
+    return OpenAI(base_url=base_url, api_key=api_key)
+
 class Author(BaseModel):
     """Represents a single author with their name, affiliation, and optional email."""
     Name: str
@@ -17,11 +38,135 @@ class AuthorList(BaseModel):
     """Represents a list of authors."""
     Authors: list[Author]
 
+class BatchAuthorList(BaseModel):
+    """Represents one AuthorList per document, in the order the documents were given."""
+    results: list[AuthorList]
+
+
+# Used by batch_get_authors to pack several author blocks into one request
+_DOCUMENT_DELIMITER = "\n\n### DOCUMENT {i} ###\n"
+_BATCH_INSTRUCTION = (
+    "\n\n## Batch Input\n"
+    "The user message contains several documents, each introduced by a '### DOCUMENT <i> ###' header. "
+    "Extract the authors of every document separately and return one AuthorList per document, in the same order as the documents."
+)
+
+# Author blocks longer than this are cut to their head and tail before being sent;
+# the authors sit at the start of a paper, so the middle is the least useful part
+MAX_CONTENT_CHARS = 20000
+_TRUNCATION_MARKER = "\n...\n"
+
+def _truncate_content(content: str) -> str:
+    """Keeps the first and last MAX_CONTENT_CHARS // 2 characters of an over-long content."""
+    if len(content) <= MAX_CONTENT_CHARS:
+        return content
+    half = MAX_CONTENT_CHARS // 2
+    return content[:half] + _TRUNCATION_MARKER + content[-half:]
+
+# JSON schema of a single author, shared by the single and batch extraction tools
+_AUTHOR_ITEM_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {
+            "type": "string",
+            "description": "The full name of the author"
+        },
+        "affiliation": {
+            "type": "string",
+            "description": "The institutional affiliation of the author"
+        },
+        "email": {
+            "type": ["string", "null"],
+            "description": "The email address of the author if available"
+        },
+        "author_order": {
+            "type": ["integer", "null"],
+            "description": "The order of the author in the author list"
+        }
+    },
+    "required": ["name", "affiliation"]
+}
+
+# The function-calling (deepseek) tools are constant, so they are built once at import time
+_DEEPSEEK_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "extract_authors",
+            "description": "Extract author information from the given text.",
+            "strict": True,
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "authors": {
+                        "type": "array",
+                        "description": "A list of authors with their information",
+                        "items": _AUTHOR_ITEM_SCHEMA
+                    }
+                },
+                "required": ["authors"]
+            }
+        }
+    }
+]
+_DEEPSEEK_TOOL_CHOICE = {"type": "function", "function": {"name": "extract_authors"}}
+
+_DEEPSEEK_BATCH_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "extract_authors_batch",
+            "description": "Extract author information from each of the given documents.",
+            "strict": True,
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "documents": {
+                        "type": "array",
+                        "description": "One entry per document, in the same order as the documents",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "authors": {
+                                    "type": "array",
+                                    "description": "A list of authors of this document with their information",
+                                    "items": _AUTHOR_ITEM_SCHEMA
+                                }
+                            },
+                            "required": ["authors"]
+                        }
+                    }
+                },
+                "required": ["documents"]
+            }
+        }
+    }
+]
+_DEEPSEEK_BATCH_TOOL_CHOICE = {"type": "function", "function": {"name": "extract_authors_batch"}}
+
+# Endpoints known to enforce "strict" tool schemas; other OpenAI-compatible endpoints
+# (e.g. dashscope's compatible mode) accept the flag but may still return loosely typed arguments
+_STRICT_TOOL_ENDPOINTS = ("api.deepseek.com/beta",)
+
+def _is_well_typed(author_data: dict) -> bool:
+    """Whether a tool-call author dict already has the field types Author expects, so validation can be skipped."""
+    name = author_data.get('name')
+    email = author_data.get('email')
+    order = author_data.get('author_order')
+    return (
+        isinstance(name, str) and bool(name)
+        and isinstance(author_data.get('affiliation', ''), str)
+        and (email is None or isinstance(email, str))
+        and isinstance(order, int) and not isinstance(order, bool)
+    )
+
 class AuthorMetadataExtractor:
     """
     A class to extract author metadata from text using an AI model.
     """
-    def __init__(self, api_base_url: str, api_key: str, model: str, prompt_path = './prompts/author_extract_prompt.txt', llm_provider: str = "ollama"):
+    def __init__(self, api_base_url: str, api_key: str, model: str, prompt_path = './prompts/author_extract_prompt.txt', llm_provider: str = "ollama", batch_size: int = 8, concurrency: int = 32,
+                 cache_enabled: bool = False, cache_path: str = './cache/author_metadata_cache.sqlite', cache_max_entries: int = 10000,
+                 validate_tool_output: bool = False):
         """
         Initializes the AuthorMetadataExtractor.
         Args:
@@ -30,12 +175,116 @@ class AuthorMetadataExtractor:
             model: The name of the model to use.
             prompt_path: The path to the system prompt file.
             llm_provider: The LLM provider to use ("ollama" or "deepseek").
+            batch_size: How many author blocks batch_get_authors packs into one request.
+                Larger batches mean fewer round-trips but a longer latency per request.
+            concurrency: The default number of requests aget_authors_many keeps in flight.
+            cache_enabled: Whether to cache results on disk, keyed by the hash of prompt, model and content.
+                Off by default; main.py already caches per paper through PaperCache/CachedAuthorExtractor.
+            cache_path: The SQLite file the cache is stored in.
+            cache_max_entries: The cache keeps at most this many results, evicting the least recently used.
+            validate_tool_output: Whether to run full pydantic validation on every function-calling result.
+                When off, validation is still run for any author whose fields are not already well typed,
+                and for all authors unless the endpoint is known to enforce the strict tool schema.
         """
-        self.client = OpenAI(base_url=api_base_url, api_key=api_key)
+        self.api_base_url = api_base_url
+        self.api_key = api_key
+        self.client = _get_openai_client(api_base_url, api_key)
+        self._aclient: Optional[AsyncOpenAI] = None
         self.model = model
         self.llm_provider = llm_provider
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            self.system_prompt = f.read()
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.validate_tool_output = validate_tool_output
+        self._strict_tool_schema = llm_provider == "deepseek" and any(endpoint in (api_base_url or "") for endpoint in _STRICT_TOOL_ENDPOINTS)
+        self.system_prompt = _load_prompt(prompt_path)
+        # Resolve the provider once; an unknown provider keeps the old behaviour of returning None
+        self._dispatch = {
+            "ollama": self._get_authors_structured_output,
+            "deepseek": self._get_authors_tool_calling,
+        }.get(llm_provider)
+        self._adispatch = {
+            "ollama": self._aget_authors_structured_output,
+            "deepseek": self._aget_authors_tool_calling,
+        }.get(llm_provider)
+
+        # The result is a pure function of (prompt, model, content), so identical author blocks never hit the LLM twice
+        self._prompt_hash = hashlib.blake2b(self.system_prompt.encode('utf-8') + self.model.encode('utf-8')).digest()
+        self.cache_path = Path(cache_path)
+        self.cache_max_entries = max(1, cache_max_entries)
+        # Reads and writes touch one row each; changes are committed once per call (or per batch) by _flush_cache
+        self._cache_lock = threading.Lock()
+        self._cache_dirty = False
+        self._cache_tick = 0
+        self._cache_db: Optional[sqlite3.Connection] = self._open_cache() if cache_enabled else None
+        self.cache_enabled = self._cache_db is not None
+
+    def _open_cache(self) -> Optional[sqlite3.Connection]:
+        """Opens (and creates if needed) the SQLite result cache."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # The commit may run in a worker thread (see aget_authors), so the connection is shared under _cache_lock
+            db = sqlite3.connect(self.cache_path, check_same_thread=False)
+            db.execute("CREATE TABLE IF NOT EXISTS author_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)")
+            db.execute("CREATE INDEX IF NOT EXISTS author_cache_used ON author_cache (used)")
+            db.commit()
+            # "used" is a logical clock: the row with the smallest value is the least recently used
+            self._cache_tick = db.execute("SELECT COALESCE(MAX(used), 0) FROM author_cache").fetchone()[0]
+            return db
+        except sqlite3.Error as e:
+            logger.error(f"加载作者缓存失败: {e}")
+            return None
+
+    def _flush_cache(self):
+        """Evicts the least recently used entries beyond cache_max_entries and commits pending changes."""
+        if self._cache_db is None or not self._cache_dirty:
+            return
+        with self._cache_lock:
+            try:
+                self._cache_db.execute(
+                    "DELETE FROM author_cache WHERE used <= (SELECT used FROM author_cache ORDER BY used DESC LIMIT 1 OFFSET ?)",
+                    (self.cache_max_entries,)
+                )
+                self._cache_db.commit()
+                self._cache_dirty = False
+            except sqlite3.Error as e:
+                logger.error(f"保存作者缓存失败: {e}")
+
+    def _cache_key(self, content: str) -> str:
+        """Hashes the content together with the prompt and model."""
+        return hashlib.blake2b(self._prompt_hash + content.encode('utf-8')).hexdigest()
+
+    def _cache_get(self, content: str) -> Optional[AuthorList]:
+        """Returns the cached AuthorList for the content, if any."""
+        if self._cache_db is None:
+            return None
+        key = self._cache_key(content)
+        with self._cache_lock:
+            try:
+                row = self._cache_db.execute("SELECT value FROM author_cache WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    return None
+                self._cache_tick += 1
+                self._cache_db.execute("UPDATE author_cache SET used = ? WHERE key = ?", (self._cache_tick, key))
+                self._cache_dirty = True
+            except sqlite3.Error as e:
+                logger.error(f"读取作者缓存失败: {e}")
+                return None
+        return AuthorList.model_validate_json(row[0])
+
+    def _cache_put(self, content: str, result: AuthorList | str | None):
+        """Stores a successful result; refusals and errors are not cached. Nothing is written to disk until _flush_cache."""
+        if self._cache_db is None or not isinstance(result, AuthorList):
+            return
+        with self._cache_lock:
+            try:
+                self._cache_tick += 1
+                self._cache_db.execute(
+                    "INSERT OR REPLACE INTO author_cache (key, value, used) VALUES (?, ?, ?)",
+                    (self._cache_key(content), result.model_dump_json(), self._cache_tick)
+                )
+                self._cache_dirty = True
+            except sqlite3.Error as e:
+                logger.error(f"保存作者缓存失败: {e}")
     
     def get_authors(self, content: str) -> AuthorList | str | None:
         """
@@ -45,114 +294,271 @@ class AuthorMetadataExtractor:
         Returns:
             An AuthorList object, a refusal message, or None if an error occurs.
         """
-        if self.llm_provider == "ollama":
-            # Original code for ollama
-            try:
+        # Nothing to extract from, so there is no point waking up the model
+        if not content or not content.strip():
+            return AuthorList(Authors=[])
+        cached = self._cache_get(content)
+        if cached is None:
+            cached = self._request_authors(content)
+            self._cache_put(content, cached)
+        self._flush_cache()
+        return cached
+
+    def _request_authors(self, content: str) -> AuthorList | str | None:
+        """
+        Sends one block of text to the LLM and parses the answer.
+        """
+        if self._dispatch is None:
+            return None
+        try:
+            return self._dispatch(content)
+        except openai.LengthFinishReasonError as e:
+            return f"Too many tokens: {e}"
+        except Exception as e:
+            return f"An error occurred: {e}"
+
+    def _get_authors_structured_output(self, content: str) -> AuthorList | str | None:
+        """
+        Extracts authors with structured output (ollama).
+        """
+        completion = self.client.beta.chat.completions.parse(**self._structured_output_request(content))
+        return self._parse_structured_output(completion)
+
+    def _get_authors_tool_calling(self, content: str) -> AuthorList | None:
+        """
+        Extracts authors with function calling (deepseek).
+        """
+        response = self.client.chat.completions.create(**self._tool_calling_request(content))
+        return self._parse_tool_calling(response)
+
+    @property
+    def aclient(self) -> AsyncOpenAI:
+        """The async client, created on first use so sync-only callers never pay for it."""
+        if self._aclient is None:
+            self._aclient = AsyncOpenAI(base_url=self.api_base_url, api_key=self.api_key)
+        return self._aclient
+
+    async def aget_authors(self, content: str) -> AuthorList | str | None:
+        """
+        Async version of get_authors.
+        Args:
+            content: A string containing author names, affiliations, and emails.
+        Returns:
+            An AuthorList object, a refusal message, or None if an error occurs.
+        """
+        result = await self._aget_authors_cached(content)
+        # The commit does disk I/O, so it runs off the event loop
+        await asyncio.to_thread(self._flush_cache)
+        return result
+
+    async def _aget_authors_cached(self, content: str) -> AuthorList | str | None:
+        """
+        aget_authors without committing the cache, so aget_authors_many can commit once for all contents.
+        """
+        if not content or not content.strip():
+            return AuthorList(Authors=[])
+        cached = self._cache_get(content)
+        if cached is not None:
+            return cached
+        result = await self._arequest_authors(content)
+        self._cache_put(content, result)
+        return result
+
+    async def _arequest_authors(self, content: str) -> AuthorList | str | None:
+        """
+        Async version of _request_authors.
+        """
+        if self._adispatch is None:
+            return None
+        try:
+            return await self._adispatch(content)
+        except openai.LengthFinishReasonError as e:
+            return f"Too many tokens: {e}"
+        except Exception as e:
+            return f"An error occurred: {e}"
+
+    async def _aget_authors_structured_output(self, content: str) -> AuthorList | str | None:
+        """
+        Async version of _get_authors_structured_output.
+        """
+        completion = await self.aclient.beta.chat.completions.parse(**self._structured_output_request(content))
+        return self._parse_structured_output(completion)
+
+    async def _aget_authors_tool_calling(self, content: str) -> AuthorList | None:
+        """
+        Async version of _get_authors_tool_calling.
+        """
+        response = await self.aclient.chat.completions.create(**self._tool_calling_request(content))
+        return self._parse_tool_calling(response)
+
+    async def aget_authors_many(self, contents: list[str], concurrency: Optional[int] = None) -> list[AuthorList | str | None]:
+        """
+        Gets structured author information for many blocks of text concurrently.
+        Keeping several requests in flight lets the LLM server batch them.
+        Args:
+            contents: A list of strings, each containing the author block of one document.
+            concurrency: The maximum number of requests in flight. Defaults to the value given to the constructor.
+        Returns:
+            A list with one result per content, in the same order, as returned by get_authors.
+        """
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+
+        async def _bounded(content: str) -> AuthorList | str | None:
+            async with semaphore:
+                return await self._aget_authors_cached(content)
+
+        results = list(await asyncio.gather(*(_bounded(content) for content in contents)))
+        await asyncio.to_thread(self._flush_cache)
+        return results
+
+    def _build_messages(self, content: str) -> list[dict]:
+        """
+        Builds the chat messages for one block of text.
+        """
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": _truncate_content(content)}
+        ]
+
+    def _structured_output_request(self, content: str) -> dict:
+        """
+        Keyword arguments of the structured-output (ollama) request.
+        """
+        return dict(
+            temperature=0,
+            model=self.model,
+            messages=self._build_messages(content),
+            response_format=AuthorList,
+        )
+
+    def _parse_structured_output(self, completion) -> AuthorList | str | None:
+        """
+        Reads the AuthorList or the refusal out of a structured-output completion.
+        """
+        pet_response = completion.choices[0].message
+        if pet_response.parsed:
+            return pet_response.parsed
+        elif pet_response.refusal:
+            return pet_response.refusal
+        return None
+
+    def _tool_calling_request(self, content: str) -> dict:
+        """
+        Keyword arguments of the function-calling (deepseek) request.
+        """
+        return dict(
+            model=self.model,
+            temperature=0,
+            messages=self._build_messages(content),
+            tools=_DEEPSEEK_TOOLS,
+            tool_choice=_DEEPSEEK_TOOL_CHOICE
+        )
+
+    def _parse_tool_calling(self, response) -> AuthorList | None:
+        """
+        Converts the function call of a deepseek response into an AuthorList.
+        """
+        message = response.choices[0].message
+        if hasattr(message, 'tool_calls') and message.tool_calls:
+            tool_call = message.tool_calls[0]
+            arguments = tool_call.function.arguments
+            if isinstance(arguments, str):
+                data = orjson.loads(arguments)
+            else:
+                data = arguments
+            return self._author_list_from_tool_data(data.get('authors', []))
+        return None
+
+    def batch_get_authors(self, contents: list[str]) -> list[AuthorList | str | None]:
+        """
+        Gets structured author information for several blocks of text.
+        The blocks are sent batch_size at a time, each request asking the model
+        for one AuthorList per block, which saves a round-trip per document.
+        Args:
+            contents: A list of strings, each containing the author block of one document.
+        Returns:
+            A list with one entry per content, each being an AuthorList object,
+            a refusal or error message, or None if nothing was returned for that document.
+        """
+        results: list[AuthorList | str | None] = [
+            self._cache_get(content) if content and content.strip() else AuthorList(Authors=[])
+            for content in contents
+        ]
+        # Only the documents missing from the cache are sent to the LLM
+        pending = [i for i, result in enumerate(results) if result is None]
+        for start in range(0, len(pending), self.batch_size):
+            indices = pending[start:start + self.batch_size]
+            chunk = [contents[i] for i in indices]
+            for i, content, result in zip(indices, chunk, self._get_authors_batch(chunk)):
+                results[i] = result
+                self._cache_put(content, result)
+        self._flush_cache()
+        return results
+
+    def _get_authors_batch(self, chunk: list[str]) -> list[AuthorList | str | None]:
+        """
+        Extracts the authors of one chunk of documents with a single LLM call.
+        """
+        user_content = "".join(_DOCUMENT_DELIMITER.format(i=i) + _truncate_content(content) for i, content in enumerate(chunk, 1))
+        messages = [
+            {"role": "system", "content": self.system_prompt + _BATCH_INSTRUCTION},
+            {"role": "user", "content": user_content}
+        ]
+        author_lists: list[AuthorList | str | None] = []
+        try:
+            if self.llm_provider == "ollama":
                 completion = self.client.beta.chat.completions.parse(
                     temperature=0,
                     model=self.model,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": content}
-                    ],
-                    response_format=AuthorList,
+                    messages=messages, # type: ignore
+                    response_format=BatchAuthorList,
                 )
-               
-                pet_response = completion.choices[0].message
-                if pet_response.parsed:
-                    return pet_response.parsed
-                elif pet_response.refusal:
-                    return pet_response.refusal
-            except openai.LengthFinishReasonError as e:
-                return f"Too many tokens: {e}"
-            except Exception as e:
-                return f"An error occurred: {e}"
-            return None
-            
-        elif self.llm_provider == "deepseek":
-            # Use function calling for deepseek
-            tools = [
-                {
-                    "type": "function",
-                    "function": {
-                        "name": "extract_authors",
-                        "description": "Extract author information from the given text.",
-                        "strict": True,
-                        "parameters": {
-                            "type": "object",
-                            "properties": {
-                                "authors": {
-                                    "type": "array",
-                                    "description": "A list of authors with their information",
-                                    "items": {
-                                        "type": "object",
-                                        "properties": {
-                                            "name": {
-                                                "type": "string",
-                                                "description": "The full name of the author"
-                                            },
-                                            "affiliation": {
-                                                "type": "string",
-                                                "description": "The institutional affiliation of the author"
-                                            },
-                                            "email": {
-                                                "type": ["string", "null"],
-                                                "description": "The email address of the author if available"
-                                            },
-                                            "author_order": {
-                                                "type": ["integer", "null"],
-                                                "description": "The order of the author in the author list"
-                                            }
-                                        },
-                                        "required": ["name", "affiliation"]
-                                    }
-                                }
-                            },
-                            "required": ["authors"]
-                        }
-                    }
-                }
-            ]
-            
-            try:
+                message = completion.choices[0].message
+                if message.parsed:
+                    author_lists = list(message.parsed.results)
+                elif message.refusal:
+                    return [message.refusal] * len(chunk)
+
+            elif self.llm_provider == "deepseek":
                 response = self.client.chat.completions.create(
                     model=self.model,
                     temperature=0,
-                    messages=[
-                        {"role": "system", "content": self.system_prompt},
-                        {"role": "user", "content": content}
-                    ],
-                    tools=tools, # type: ignore
-                    tool_choice={"type": "function", "function": {"name": "extract_authors"}}
+                    messages=messages, # type: ignore
+                    tools=_DEEPSEEK_BATCH_TOOLS, # type: ignore
+                    tool_choice=_DEEPSEEK_BATCH_TOOL_CHOICE # type: ignore
                 )
-                
-                # Parse the function call response
-                choice = response.choices[0]
-                message = choice.message
-                
+                message = response.choices[0].message
                 if hasattr(message, 'tool_calls') and message.tool_calls:
-                    tool_call = message.tool_calls[0]
-                    arguments = tool_call.function.arguments # type: ignore
-                    if isinstance(arguments, str):
-                        data = json.loads(arguments)
-                    else:
-                        data = arguments
-                    
-                    # Convert to AuthorList
-                    authors = []
-                    for author_data in data.get('authors', []):
-                        author = Author(
-                            Name=author_data.get('name', ''),
-                            Affiliation=author_data.get('affiliation', ''),
-                            Email=author_data.get('email'),
-                            Author_Order=author_data.get('author_order')
-                        )
-                        authors.append(author)
-                    
-                    return AuthorList(Authors=authors)
-                    
-            except openai.LengthFinishReasonError as e:
-                return f"Too many tokens: {e}"
-            except Exception as e:
-                return f"An error occurred: {e}"
-            return None
\ No newline at end of file
+                    arguments = message.tool_calls[0].function.arguments # type: ignore
+                    data = orjson.loads(arguments) if isinstance(arguments, str) else arguments
+                    author_lists = [
+                        self._author_list_from_tool_data(document.get('authors', []))
+                        for document in data.get('documents', [])
+                    ]
+        except openai.LengthFinishReasonError as e:
+            return [f"Too many tokens: {e}"] * len(chunk)
+        except Exception as e:
+            return [f"An error occurred: {e}"] * len(chunk)
+
+        # The model may return fewer (or more) results than documents; keep the output aligned with the input
+        author_lists = author_lists[:len(chunk)]
+        author_lists.extend([None] * (len(chunk) - len(author_lists)))
+        return author_lists
+
+    def _author_list_from_tool_data(self, authors_data: list[dict]) -> AuthorList:
+        """
+        Converts the author dicts of a tool call into an AuthorList.
+        """
+        # model_construct skips validation, so it is only used when the endpoint enforces the strict schema
+        # and the fields already have the right types; anything else goes through Author(...) and is coerced or rejected
+        skip_validation = self._strict_tool_schema and not self.validate_tool_output
+        authors = [
+            (Author.model_construct if skip_validation and _is_well_typed(author_data) else Author)(
+                Name=author_data.get('name', ''),
+                Affiliation=author_data.get('affiliation', ''),
+                Email=author_data.get('email'),
+                Author_Order=author_data.get('author_order')
+            )
+            for author_data in authors_data
+        ]
+        return AuthorList.model_construct(Authors=authors)
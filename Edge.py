@@ -1,19 +1,40 @@
-import uuid
-import json
+import itertools
+import orjson
+from operator import attrgetter
 from typing import Dict, Any, List, Type, Optional
 from Node import Author, Paper, Affiliation, Entity
 
+# 边的ID只在进程内使用(__repr__/to_dict), 用自增整数代替uuid4, 省去每条边一次os.urandom和UUID对象的开销
+_edge_id_counter = itertools.count()
+
+# 按节点的具体类型直接取显示名称/ID, 代替逐个 hasattr 试探; 其他类型仍走 hasattr 的兜底逻辑
+_NODE_DISPLAY_NAME_GETTERS = {
+    Author: attrgetter('Name'),
+    Affiliation: attrgetter('Name'),
+    Paper: attrgetter('Title'),
+    Entity: attrgetter('name'),
+}
+_NODE_ID_GETTERS = {
+    Author: attrgetter('export_id'),
+    Entity: attrgetter('export_id'),
+    Paper: attrgetter('Title'),
+    Affiliation: attrgetter('Name'),
+}
+
 class BaseEdge:
     """
     知识图谱中所有边的基类。
 
     Attributes:
-        _id (uuid.UUID): 边的唯一标识符。
+        _id (int): 边的唯一标识符, 进程内自增。
         source (Any): 边的源节点。
         target (Any): 边的目标节点。
         relation (str): 描述关系类型的字符串。
         attributes (Dict[str, Any]): 存储边特定属性的字典。
     """
+    # 图里会有大量的边对象, 用__slots__去掉每个实例的__dict__
+    __slots__ = ('_id', 'source', 'target', 'relation', 'attributes', '_source_type', '_target_type')
+
     def __init__(self, source_node: Any, target_node: Any, relation: str, **kwargs):
         """
         初始化一个边的实例。
@@ -23,9 +44,12 @@ class BaseEdge:
             relation: 关系的名称。
             **kwargs: 边的其他属性。
         """
-        self._id = uuid.uuid4()
+        self._id = next(_edge_id_counter)
         self.source = source_node
         self.target = target_node
+        # 节点类型名在边的生命周期内不变, 构造时算一次, __repr__/to_dict直接复用
+        self._source_type = type(source_node).__name__
+        self._target_type = type(target_node).__name__
         self.relation = relation
         self.attributes = kwargs
 
@@ -39,6 +63,9 @@ class BaseEdge:
         Returns:
             str: 节点的友好显示名称
         """
+        getter = _NODE_DISPLAY_NAME_GETTERS.get(type(node))
+        if getter is not None:
+            return getter(node)
         # 根据不同的节点类型返回相应的显示名称
         if hasattr(node, 'Name'):  # Author 和 Affiliation 都有 Name 属性
             return node.Name
@@ -60,8 +87,11 @@ class BaseEdge:
         Returns:
             str: 节点的唯一标识符
         """
-        if hasattr(node, '_id'):  # Author 和 Entity 有 _id
-            return str(node._id)
+        getter = _NODE_ID_GETTERS.get(type(node))
+        if getter is not None:
+            return getter(node)
+        if hasattr(node, '_id'):  # Author 和 Entity 有 _id, 使用带类型前缀的导出ID
+            return getattr(node, 'export_id', str(node._id))
         elif hasattr(node, 'Title'):  # Paper 使用 Title 作为唯一标识
             return node.Title
         elif hasattr(node, 'Name'):  # Affiliation 使用 Name 作为唯一标识
@@ -73,33 +103,49 @@ class BaseEdge:
         """返回一个可读的边表示。"""
         source_name = self._get_node_display_name(self.source)
         target_name = self._get_node_display_name(self.target)
-        source_type = self.source.__class__.__name__
-        target_type = self.target.__class__.__name__
         
         # 提供更友好的显示格式
-        return f"Edge({source_type}:'{source_name}' -[{self.relation}]-> {target_type}:'{target_name}')"
+        return f"Edge({self._source_type}:'{source_name}' -[{self.relation}]-> {self._target_type}:'{target_name}')"
 
     def to_dict(self) -> Dict[str, Any]:
         """将边对象序列化为字典。"""
         return {
             'id': str(self._id),
             'source': {
-                'type': self.source.__class__.__name__,
+                'type': self._source_type,
                 'id': self._get_node_id(self.source),
                 'display_name': self._get_node_display_name(self.source)
             },
             'target': {
-                'type': self.target.__class__.__name__,
+                'type': self._target_type,
                 'id': self._get_node_id(self.target),
                 'display_name': self._get_node_display_name(self.target)
             },
             'relation': f"**{self.relation}**",  # 加粗处理, 发现LLM真的理解加粗的内容
-            'attributes': self.attributes
+            'attributes': {**self._get_typed_attributes(), **self.attributes}
         }
 
-    def to_json(self, **kwargs) -> str:
-        """将边对象序列化为JSON字符串。"""
-        return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
+    def _get_typed_attributes(self) -> Dict[str, Any]:
+        """子类中固定的属性(weight, author_order等)存成slot字段, 序列化时在这里汇总。"""
+        return {}
+
+    def _get_graph_attributes(self) -> Dict[str, Any]:
+        """导出图时使用的类型属性; 键名与导出的JSON一致, 默认与 _get_typed_attributes 相同。"""
+        return self._get_typed_attributes()
+
+    def graph_attributes(self) -> Dict[str, Any]:
+        """
+        导出图时这条边的全部可序列化属性。
+        图中只保存 edge_type 和边对象本身, relation/weight 等属性在导出时才从边对象生成。
+        """
+        attrs = {'relation': self.relation}
+        attrs.update(self._get_graph_attributes())
+        attrs['display_info'] = self.get_simple_display()
+        return attrs
+
+    def to_json(self, indent: int = 0) -> str:
+        """将边对象序列化为JSON字符串。用orjson(C实现)代替json.dumps, 输出本身就是UTF-8, 不转义中文; indent非0时缩进2格。"""
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 if indent else 0).decode()
 
     def get_simple_display(self) -> str:
         """
@@ -117,79 +163,103 @@ class BaseEdge:
 #! weight的算法放在之后的文件里面
 class AuthorPaperEdge(BaseEdge):
     """定义"作者-撰写->论文"的边。"""
+    __slots__ = ('author_order', 'weight')
+
     def __init__(self, author: Author, paper: Paper, author_order: int = 0):
         super().__init__(
             source_node=author,
             target_node=paper,
-            relation="writes",
-            author_order=author_order,
-            weight = 0.0 # 初始权重为0.0
+            relation="writes"
         )
+        self.author_order = author_order
+        self.weight = 0.0 # 初始权重为0.0
     
     def update_weight(self, new_weight: float):
-        self.attributes['weight'] = new_weight
+        self.weight = new_weight
+
+    def _get_typed_attributes(self) -> Dict[str, Any]:
+        return {'author_order': self.author_order, 'weight': self.weight}
     
     def __repr__(self) -> str:
         """覆盖父类方法，添加作者顺序信息"""
         base_repr = super().__repr__()
-        order = self.attributes.get('author_order', 0)
-        return base_repr.replace(')', f', order={order})')
+        return base_repr.replace(')', f', order={self.author_order})')
 
 
 
 #! 定义了一个Rank属性, 用来规范author再affiliation中的顺序, 具体算法之后规定
 class AuthorAffiliationEdge(BaseEdge):
     """定义"作者-从属于->机构"的边。"""
+    __slots__ = ('rank',)
+
     def __init__(self, author: Author, affiliation: Affiliation):
         super().__init__(
             source_node=author,
             target_node=affiliation,
-            relation="is_affiliated_with",
-            rank = 0 # 初始化排名为0
+            relation="is_affiliated_with"
         )
+        self.rank = 0 # 初始化排名为0
 
     def update_rank(self, new_rank: int):
         """更新作者在机构中的排名。"""
-        self.attributes['rank'] = new_rank  
+        self.rank = new_rank
+
+    def _get_typed_attributes(self) -> Dict[str, Any]:
+        return {'rank': self.rank}
 
 
 class AuthorCoauthorEdge(BaseEdge):
     """定义"作者-合作者->作者"的边。"""
+    __slots__ = ('weight', 'coauthored_paper_list', '_coauthored_paper_set')
+
     def __init__(self, author1: Author, author2: Author, coauthored_paper: Paper):      # 建立合作者关系时，必须指定一篇共同撰写的论文
-        # 为避免重复，可以约定一个顺序，例如基于哈希值
-        if hash(author1) > hash(author2):
+        # 为避免重复，可以约定一个顺序，例如基于哈希值(Author上缓存的_hash, 不必每次走__hash__)
+        if author1._hash > author2._hash:
             author1, author2 = author2, author1
             
         super().__init__(
             source_node=author1,
             target_node=author2,
-            relation="coauthor_of",
-            weight = 0.0,  # 初始权重为0.0
-            coauthored_paper_list=[coauthored_paper]  # 用list表示
+            relation="coauthor_of"
         )
+        self.weight = 0.0  # 初始权重为0.0
+        self.coauthored_paper_list: List[Paper] = [coauthored_paper]  # 用list表示
+        self._coauthored_paper_set = {coauthored_paper}  # 与list同步的set, 查重O(1); Paper按Title判等, 和list的in语义一致
 
     def update_weight(self, new_weight: float):
         """更新合作者之间的权重。"""
-        self.attributes['weight'] = new_weight
+        self.weight = new_weight
 
     def add_coauthored_paper(self, new_paper: Paper):
         """添加一篇新的共同撰写的论文。"""
-        if 'coauthored_paper_list' not in self.attributes:
-            self.attributes['coauthored_paper_list'] = []
-        # 修正：原代码中使用了错误的key名称
-        if new_paper not in self.attributes['coauthored_paper_list']:
-            self.attributes['coauthored_paper_list'].append(new_paper)
+        if new_paper not in self._coauthored_paper_set:
+            self._coauthored_paper_set.add(new_paper)
+            self.coauthored_paper_list.append(new_paper)
+
+    def _get_typed_attributes(self) -> Dict[str, Any]:
+        return {
+            'weight': self.weight,
+            'coauthored_paper_list': [paper.Title for paper in self.coauthored_paper_list]
+        }
+
+    def _get_graph_attributes(self) -> Dict[str, Any]:
+        return {
+            'weight': self.weight,
+            'coauthored_papers': [paper.Title for paper in self.coauthored_paper_list]
+        }
     
     def __repr__(self) -> str:
         """覆盖父类方法，添加合作论文数量信息"""
         base_repr = super().__repr__()
-        paper_count = len(self.attributes.get('coauthored_paper_list', []))
+        paper_count = len(self.coauthored_paper_list)
         return base_repr.replace(')', f', papers_count={paper_count})')
 
 
 # 这个edge感觉关心的人比较少, 简单处理了
 class PaperAffiliationEdge(BaseEdge):
     """定义"论文-关联->机构"的边。"""
+    __slots__ = ()
+
     def __init__(self, paper: Paper, affiliation: Affiliation):
         super().__init__(
             source_node=paper,
@@ -201,6 +271,8 @@ class PaperAffiliationEdge(BaseEdge):
 # paper citation已经有很多现成的工具了, 这个就不细讲了
 class PaperCitationEdge(BaseEdge):
     """定义"论文-引用->论文"的边。"""
+    __slots__ = ()
+
     def __init__(self, citing_paper: Paper, cited_paper: Paper):
         super().__init__(
             source_node=citing_paper,
@@ -211,22 +283,29 @@ class PaperCitationEdge(BaseEdge):
 
 class PaperEntityEdge(BaseEdge):
     """定义"论文-提及->实体"的边。"""
+    __slots__ = ('weight',)
+
     def __init__(self, paper: Paper, entity: Entity):
         super().__init__(
             source_node=paper,
             target_node=entity,
-            relation="researchs",
-            weight = 0.0 # 相当于importance, 初始化为0.0
+            relation="researchs"
         )
+        self.weight = 0.0 # 相当于importance, 初始化为0.0
     
     # 这个nano_graphrag里面有weight, 可以直接用maybe
     def update_weight(self, new_weight: float):
         """更新论文与实体之间的权重。"""
-        self.attributes['weight'] = new_weight
+        self.weight = new_weight
+
+    def _get_typed_attributes(self) -> Dict[str, Any]:
+        return {'weight': self.weight}
 
 
 class AffiliationCollaborationEdge(BaseEdge):
     """定义"机构-合作->机构"的边。"""
+    __slots__ = ('weight', 'collaboration_paper_list', '_collaboration_paper_set')
+
     def __init__(self, affiliation1: Affiliation, affiliation2: Affiliation, collaboration_paper: Paper):
         # 为避免重复，可以约定一个顺序，例如基于哈希值
         if hash(affiliation1) > hash(affiliation2):
@@ -235,25 +314,38 @@ class AffiliationCollaborationEdge(BaseEdge):
         super().__init__(
             source_node=affiliation1,
             target_node=affiliation2,
-            relation="collaborates_with",
-            weight = 0.0,  # 初始权重为0.0
-            collaboration_paper_list=[collaboration_paper]  # 用list表示
+            relation="collaborates_with"
         )
+        self.weight = 0.0  # 初始权重为0.0
+        self.collaboration_paper_list: List[Paper] = [collaboration_paper]  # 用list表示
+        self._collaboration_paper_set = {collaboration_paper}  # 与list同步的set, 查重O(1)
 
     def update_weight(self, new_weight: float):
         """更新机构之间的权重。"""
-        self.attributes['weight'] = new_weight
+        self.weight = new_weight
 
     def add_collaboration_paper(self, new_paper: Paper):
         """添加一篇新的合作论文。"""
-        if 'collaboration_paper_list' not in self.attributes:
-            self.attributes['collaboration_paper_list'] = []
-        # 修正：原代码中使用了错误的key名称
-        if new_paper not in self.attributes['collaboration_paper_list']:
-            self.attributes['collaboration_paper_list'].append(new_paper)
+        if new_paper not in self._collaboration_paper_set:
+            self._collaboration_paper_set.add(new_paper)
+            self.collaboration_paper_list.append(new_paper)
+
+    def _get_typed_attributes(self) -> Dict[str, Any]:
+        return {
+            'weight': self.weight,
+            'collaboration_paper_list': [paper.Title for paper in self.collaboration_paper_list]
+        }
+
+    def _get_graph_attributes(self) -> Dict[str, Any]:
+        return {
+            'weight': self.weight,
+            'collaboration_papers': [paper.Title for paper in self.collaboration_paper_list]
+        }
 
 class EntityToEntityEdge(BaseEdge):
     """定义"实体-关联->实体"的边。"""
+    __slots__ = ('relationship_description', 'strength')
+
     def __init__(self, source_entity: Entity, target_entity: Entity, 
                  relationship_description: str, strength: float = 0.0):
         """
@@ -268,22 +360,28 @@ class EntityToEntityEdge(BaseEdge):
         super().__init__(
             source_node=source_entity,
             target_node=target_entity,
-            relation="relates_to",  # 通用的关系类型
-            relationship_description=relationship_description,
-            strength=strength
+            relation="relates_to"  # 通用的关系类型
         )
+        self.relationship_description = relationship_description
+        self.strength = strength
 
     def update_strength(self, new_strength: float):
         """更新实体之间的关系强度。"""
-        self.attributes['strength'] = new_strength
+        self.strength = new_strength
 
     def get_relationship_description(self) -> str:
         """获取关系描述。"""
-        return self.attributes.get('relationship_description', '')
+        return self.relationship_description
 
     def get_strength(self) -> float:
         """获取关系强度。"""
-        return self.attributes.get('strength', 0.0)
+        return self.strength
+
+    def _get_typed_attributes(self) -> Dict[str, Any]:
+        return {'relationship_description': self.relationship_description, 'strength': self.strength}
+
+    def _get_graph_attributes(self) -> Dict[str, Any]:
+        return {'description': self.relationship_description, 'strength': self.strength}
 
     def get_simple_display(self) -> str:
         """返回简单的显示格式，用于用户界面展示。"""
@@ -1,3 +1,4 @@
+import bisect
 import mistune
 from typing import List, Dict, Any, Tuple, Optional
 
@@ -14,50 +15,88 @@ class MDParser:
         # 使用 mistune v2+ 的标准方式创建解析器
         self.parser = mistune.create_markdown(renderer='ast')
         self.ast = self.parser(markdown_content) # type: ignore[assignment]
+        # AST 解析后不再改变, 按 id(children) 缓存每个子树重建出的文本, 避免同一标题/段落被反复重建
+        self._text_cache: Dict[int, str] = {}
+        self._build_heading_index()
+
+    def _build_heading_index(self):
+        """
+        (内部辅助方法) 遍历一次 AST, 建立标题索引, 之后的标题查询都是字典查找。
+        """
+        # 按文档顺序排列的 (AST 下标, level), 以及单独的下标列表供 bisect 使用
+        self._headings_in_order: List[Tuple[int, Optional[int]]] = []
+        self._heading_positions: List[int] = []
+        # (level, 标题小写文本) -> AST 下标 / 标题小写文本 -> AST 下标, 都只记录第一次出现的位置
+        self._heading_index: Dict[Tuple[Optional[int], str], int] = {}
+        self._heading_by_title: Dict[str, int] = {}
+        # level -> 该级别第一个标题的 AST 下标; 以及第一个带 level 的标题
+        self._first_heading_by_level: Dict[int, int] = {}
+        self._first_heading: int = -1
+
+        for i, node in enumerate(self.ast):
+            if node.get('type') != 'heading': # type: ignore[assignment]
+                continue
+            node_level = node.get('attrs', {}).get('level') # type: ignore[assignment]
+            text = ""
+            if 'children' in node:
+                text = self._get_text_from_children(node['children']).strip().lower() # type: ignore[assignment]
+
+            self._headings_in_order.append((i, node_level))
+            self._heading_positions.append(i)
+            self._heading_index.setdefault((node_level, text), i)
+            self._heading_by_title.setdefault(text, i)
+            if node_level is not None:
+                self._first_heading_by_level.setdefault(node_level, i)
+                if self._first_heading < 0:
+                    self._first_heading = i
 
     def _get_text_from_children(self, children: List[Dict[str, Any]]) -> str:
         """
-        (内部辅助方法) 递归地从子节点列表中重建完整的文本内容。
+        (内部辅助方法) 从子节点列表中重建完整的文本内容。
         此方法现在可以正确处理 mistune v2+ 的 AST 结构。
+        用显式栈做深度优先遍历, 代替递归, 嵌套很深的行内结构也不会触发 RecursionError。
         """
+        key = id(children)
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            return cached
+
         text_parts = []
-        for child in children:
+        # 逆序压栈, 出栈顺序即文档顺序
+        stack = list(reversed(children))
+        while stack:
+            child = stack.pop()
             # 文本节点现在使用 'raw' 键
             if child.get('type') == 'text':
                 text_parts.append(child.get('raw', ''))
-            # 递归地从其他包含文本的节点中提取
+            # 从其他包含文本的节点中提取; 已经重建过的子树直接用缓存
             elif 'children' in child:
-                text_parts.append(self._get_text_from_children(child['children']))
-        return "".join(text_parts)
+                sub_cached = self._text_cache.get(id(child['children']))
+                if sub_cached is not None:
+                    text_parts.append(sub_cached)
+                else:
+                    stack.extend(reversed(child['children']))
+        text = "".join(text_parts)
+        self._text_cache[key] = text
+        return text
 
     def _find_heading_node(self, title: str, level: Optional[int] = None) -> Tuple[Optional[Dict[str, Any]], int]:
         """
         (内部辅助方法) 在 AST 中查找匹配的标题节点。
         """
         search_title = title.strip().lower()
-        for i, node in enumerate(self.ast):
-            # --- 核心修复 1: 检查 'attrs' 中的 'level' ---
-            node_attrs = node.get('attrs', {}) # type: ignore[assignment]
-            node_level = node_attrs.get('level')
+        # 如果不提供标题，则匹配该级别(或任意级别)的第一个标题
+        if not search_title:
+            i = self._first_heading if level is None else self._first_heading_by_level.get(level, -1)
+        # 如果提供了标题，则进行精确匹配
+        elif level is None:
+            i = self._heading_by_title.get(search_title, -1)
+        else:
+            i = self._heading_index.get((level, search_title), -1)
 
-            if node.get('type') == 'heading': # type: ignore[assignment]
-                # 如果指定了 level，但节点级别不匹配，则跳过
-                if level is not None and node_level != level:
-                    continue
-                
-                # --- 核心修复 2: 使用新的辅助方法从 'children' 重建标题文本 ---
-                full_heading_text = ""
-                if 'children' in node:
-                    full_heading_text = self._get_text_from_children(node['children']).strip().lower() # type: ignore[assignment]
-
-                # 如果不提供标题，则匹配该级别的第一个标题
-                if not search_title:
-                    if node_level is not None:
-                         return node, i # type: ignore[assignment]
-                # 如果提供了标题，则进行精确匹配
-                elif full_heading_text == search_title: 
-                    return node, i # type: ignore[assignment]
-        return None, -1
+        if i < 0:
+            return None, -1
+        return self.ast[i], i # type: ignore[assignment]
 
     def _reconstruct_text_from_nodes(self, nodes: List[Dict[str, Any]]) -> str:
         """
@@ -95,15 +134,13 @@ class MDParser:
         if not start_node:
             return None
 
-        content_nodes = []
         heading_level = start_node.get('attrs', {}).get('level')
         if heading_level is None: return ""
 
-        for i in range(start_index + 1, len(self.ast)):
-            node = self.ast[i]
-            # 同样需要检查 attrs['level']
-            node_level = node.get('attrs', {}).get('level') # type: ignore[assignment]
-            if node.get('type') == 'heading' and node_level is not None and node_level <= heading_level:  # type: ignore[assignment]
+        # 在标题索引里二分定位起始标题, 只需向后检查其余标题, 不必扫描全部 AST 节点
+        end_index = len(self.ast)
+        for i, node_level in self._headings_in_order[bisect.bisect_right(self._heading_positions, start_index):]:
+            if node_level is not None and node_level <= heading_level:
+                end_index = i
                 break
-            content_nodes.append(node)
-        return self._reconstruct_text_from_nodes(content_nodes)
\ No newline at end of file
+        return self._reconstruct_text_from_nodes(self.ast[start_index + 1:end_index]) # type: ignore[arg-type]
\ No newline at end of file
@@ -1,11 +1,17 @@
-import json
-import uuid
+import itertools
+import sys
 from typing import List, Optional, Dict, Any
-import networkx as nx
+import orjson
+
+# Author 和 Entity 的ID只需在进程内唯一(用作图节点ID和哈希), 用自增整数代替uuid4;
+# 两者共用一个计数器, 保证同一张图里的 Author 节点和 Entity 节点ID不会冲突
+_NODE_IDS = itertools.count()
 
 
 class Entity:
     """Represents a research entity, such as a field, topic, or keyword."""
+    __slots__ = ('_id', 'name', 'field', 'description', 'entity_type')
+
     def __init__(self, name: str, field: Optional[str] = None, description: Optional[str] = None, entity_type: Optional[str] = None):
         """
         Initializes an Entity object.
@@ -15,37 +21,45 @@ class Entity:
             field: The field of the entity (e.g., "Computer Science").
             description: A brief description of the entity (e.g., "Study of algorithms that improve automatically through experience").
         """
-        self._id = uuid.uuid4()  # Unique identifier for the entity
+        self._id = next(_NODE_IDS)  # Unique identifier for the entity
         self.name = name
-        self.field = field
+        # field/entity_type只有少量取值, 在大量Entity之间重复, intern后共享同一个str对象
+        self.field = sys.intern(field) if field else field
         self.description = description
-        self.entity_type = entity_type 
+        self.entity_type = sys.intern(entity_type) if entity_type else entity_type
 
     def __eq__(self, other):
         return isinstance(other, Entity) and self._id == other._id
     
     def __hash__(self):
-        return hash(self._id) # 这里选择哈希id, 因为可能会创建name一样的Entity, 比如最经典的LLM(Large Language Model)和LLM(Legum Magister)所以不得不使用uuid
+        return self._id # 这里选择哈希id, 因为可能会创建name一样的Entity, 比如最经典的LLM(Large Language Model)和LLM(Legum Magister)所以不得不使用唯一id
     
+    @property
+    def export_id(self) -> str:
+        """The node ID used in exported graphs; prefixed so it cannot collide with a paper title or affiliation name."""
+        return f"entity:{self._id}"
+
     def to_dict(self) -> Dict[str, Any]:
         """Converts the Entity object to a dictionary."""
         return {
-                "id": self._id, 
+                "id": str(self._id), 
                 "name": self.name, 
                 "field": self.field, 
                 "description": self.description,
                 "entity_type": self.entity_type
             }
 
-    def to_json(self, indent: int = 5) -> str:
-        """Converts the Entity object to a JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: int = 0) -> str:
+        """Converts the Entity object to a JSON string (pretty-printed with 2 spaces if indent is set)."""
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 if indent else 0).decode()
 
     def __repr__(self) -> str:
         return f"Entity(name='{self.name}'\nfield='{self.field}'\ndescription='{self.description}'\nentity_type='{self.entity_type}')"
 
 class Paper:
     """Represents a single research paper."""
+    __slots__ = ('Title', 'field', 'Abstract')
+
     def __init__(self, title: str, abstract: str ,field: Optional[str] = None):
         """
         Initializes a Paper object.
@@ -53,8 +67,9 @@ class Paper:
         Args:
             abstract: The abstract of the paper.
         """
-        self.Title = title
-        self.field = field 
+        # 去掉首尾空白后的标题同时用于判等、哈希和图节点ID, 三者保持一致
+        self.Title = sys.intern(title.strip())
+        self.field = sys.intern(field) if field else field
         self.Abstract = abstract
 
     def __eq__(self, other):
@@ -74,15 +89,17 @@ class Paper:
             "Field": self.field
         }
 
-    def to_json(self, indent: int = 4) -> str:
-        """Converts the Paper object to a JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: int = 0) -> str:
+        """Converts the Paper object to a JSON string (pretty-printed with 2 spaces if indent is set)."""
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 if indent else 0).decode()
 
     def __repr__(self) -> str:
         return f"Paper(Title='{self.Title}'\nfield='{self.field}')"
 
 class Author:
     """Represents a single author."""
+    __slots__ = ('_id', '_hash', 'Name', 'Email')
+
     def __init__(self, name: str, email: Optional[str] = None):
         """
         Initializes an Author object.
@@ -91,7 +108,8 @@ class Author:
             name: The name of the author.
             email: The author's email address (optional).
         """
-        self._id = uuid.uuid4()  # Unique identifier for the author
+        self._id = next(_NODE_IDS)  # Unique identifier for the author
+        self._hash = self._id  # An int id is its own hash; kept as a slot for the coauthor edge ordering
         self.Name: str = name
         self.Email: Optional[str] = email
 
@@ -99,7 +117,12 @@ class Author:
         return isinstance(other, Author) and self._id == other._id
     
     def __hash__(self):
-        return hash(self._id)
+        return self._hash
+
+    @property
+    def export_id(self) -> str:
+        """The node ID used in exported graphs; prefixed so it cannot collide with a paper title or affiliation name."""
+        return f"author:{self._id}"
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -111,9 +134,9 @@ class Author:
             "Email": self.Email,
         }
 
-    def to_json(self, indent: int = 4) -> str:
-        """Converts the Author object to a JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: int = 0) -> str:
+        """Converts the Author object to a JSON string (pretty-printed with 2 spaces if indent is set)."""
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 if indent else 0).decode()
 
     def __repr__(self) -> str:
         return f"Author(Name: {self.Name}\nEmail: {self.Email or 'N/A'})"
@@ -121,6 +144,8 @@ class Author:
 
 class Affiliation:
     """Represents an affiliation, such as a university or research institution."""
+    __slots__ = ('Name',)
+
     def __init__(self, name: str):
         """
         Initializes an Affiliation object.
@@ -128,7 +153,7 @@ class Affiliation:
         Args:
             name: The name of the affiliation (e.g., "MIT").
         """
-        self.Name: str = name
+        self.Name: str = sys.intern(name.strip())  # 同一机构会在许多论文中重复出现; 与 Paper 相同, 去掉首尾空白
 
     def __eq__(self, other):
         return isinstance(other, Affiliation) and self.Name == other.Name
@@ -140,9 +165,9 @@ class Affiliation:
         """Converts the Affiliation object to a dictionary."""
         return {"Name": self.Name}
 
-    def to_json(self, indent: int = 4) -> str:
-        """Converts the Affiliation object to a JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+    def to_json(self, indent: int = 0) -> str:
+        """Converts the Affiliation object to a JSON string (pretty-printed with 2 spaces if indent is set)."""
+        return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2 if indent else 0).decode()
 
     def __repr__(self) -> str:
         return f"Affiliation(Name='{self.Name}')"
\ No newline at end of file
@@ -1,8 +1,7 @@
 import subprocess
 import shutil
 from pathlib import Path
-from typing import Optional
-import pypdfium2 as pdfium
+from typing import List, Optional
 
 class PDFProcessor:
     """
@@ -38,17 +37,17 @@ class PDFProcessor:
                 "或访问: https://github.com/facebookresearch/nougat"
             )
     
+    # 进程内只检查一次 nougat 是否可用, None 表示还没检查过
+    _nougat_installed: Optional[bool] = None
+
     def _check_nougat_installed(self) -> bool:
-        """检查 nougat 命令是否可用"""
-        try:
-            result = subprocess.run(
-                ["nougat", "--help"], 
-                capture_output=True, 
-                text=True
-            )
-            return result.returncode == 0
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return False
+        """
+        检查 nougat 命令是否可用
+        只在 PATH 中查找可执行文件, 不再运行 `nougat --help`(会导入 torch 等重量级库, 冷启动要好几秒)
+        """
+        if PDFProcessor._nougat_installed is None:
+            PDFProcessor._nougat_installed = shutil.which("nougat") is not None
+        return PDFProcessor._nougat_installed
     
     
     def process_single_pdf(self, pdf_path: Path) -> bool:
@@ -71,23 +70,9 @@ class PDFProcessor:
         print(f"正在处理: {pdf_path.name}")
         
         try:
-            # 构建 nougat 命令
-            cmd = [
-                "nougat",
-                str(pdf_path),                    # 输入 PDF
-                "-o", str(self.output_dir),       # 输出目录
-                "-p", "1",                         # 只处理第一页
-                "--markdown",                      # 输出 Markdown 格式
-                "--no-skipping",                   # 不跳过任何内容
-            ]
-            
-            # 添加模型参数（如果指定）
-            if self.model:
-                cmd.extend(["-m", self.model])
-            
             # 执行命令
             result = subprocess.run(
-                cmd,
+                self._build_nougat_cmd([pdf_path]),
                 capture_output=True,
                 text=True,
                 timeout=300  # 5分钟超时
@@ -97,27 +82,7 @@ class PDFProcessor:
                 print(f"✗ Nougat 处理失败: {result.stderr}")
                 return False
             
-            # 重命名生成的 .mmd 文件为 .md
-            mmd_path = self.output_dir / f"{pdf_path.stem}.mmd"
-            
-            if mmd_path.exists():
-                # 读取内容
-                content = mmd_path.read_text(encoding='utf-8')
-                
-                # 清理内容（移除多余空行）
-                cleaned_content = self.clean_markdown(content)
-                
-                # 写入 .md 文件
-                md_path.write_text(cleaned_content, encoding='utf-8')
-                
-                # 删除原始 .mmd 文件
-                mmd_path.unlink()
-                
-                print(f"✓ 成功保存到: {md_path}")
-                return True
-            else:
-                print(f"✗ 未找到输出文件")
-                return False
+            return self._finalize_output(pdf_path)
                 
         except subprocess.TimeoutExpired:
             print(f"✗ 处理超时: {pdf_path.name}")
@@ -126,6 +91,90 @@ class PDFProcessor:
         except Exception as e:
             print(f"✗ 处理出错: {e}")
             return False
+
+    def process_pdfs_batch(self, pdf_paths: List[Path]) -> List[bool]:
+        """
+        用一次 nougat 调用处理多个 PDF 文件的第一页
+        nougat 每次启动都要加载模型, 对只处理一页的任务来说加载时间远大于推理时间, 批量调用只加载一次
+        
+        Args:
+            pdf_paths: PDF 文件路径列表
+            
+        Returns:
+            与输入顺序一致的是否成功处理列表
+        """
+        pending = [pdf_path for pdf_path in pdf_paths if not (self.output_dir / f"{pdf_path.stem}.md").exists()]
+        pending_set = set(pending)
+        for pdf_path in pdf_paths:
+            if pdf_path not in pending_set:
+                print(f"✓ 已存在，跳过: {self.output_dir / f'{pdf_path.stem}.md'}")
+        
+        if pending:
+            print(f"正在批量处理 {len(pending)} 个 PDF 文件")
+            try:
+                result = subprocess.run(
+                    self._build_nougat_cmd(pending),
+                    capture_output=True,
+                    text=True,
+                    timeout=300 * len(pending)  # 每个文件5分钟
+                )
+                if result.returncode != 0:
+                    print(f"✗ Nougat 批量处理失败: {result.stderr}")
+            except subprocess.TimeoutExpired:
+                print(f"✗ 批量处理超时")
+            except Exception as e:
+                print(f"✗ 批量处理出错: {e}")
+        
+        results = []
+        for pdf_path in pdf_paths:
+            if pdf_path not in pending_set:
+                results.append(True)
+            elif (self.output_dir / f"{pdf_path.stem}.mmd").exists():
+                results.append(self._finalize_output(pdf_path))
+            else:
+                # 批量调用没有产出这个文件, 单独再试一次
+                results.append(self.process_single_pdf(pdf_path))
+        return results
+
+    def _build_nougat_cmd(self, pdf_paths: List[Path]) -> List[str]:
+        """构建 nougat 命令, 可以一次传入多个 PDF"""
+        cmd = [
+            "nougat",
+            *[str(pdf_path) for pdf_path in pdf_paths],  # 输入 PDF
+            "-o", str(self.output_dir),       # 输出目录
+            "-p", "1",                         # 只处理第一页
+            "--markdown",                      # 输出 Markdown 格式
+            "--no-skipping",                   # 不跳过任何内容
+        ]
+        
+        # 添加模型参数（如果指定）
+        if self.model:
+            cmd.extend(["-m", self.model])
+        return cmd
+
+    def _finalize_output(self, pdf_path: Path) -> bool:
+        """将 nougat 生成的 .mmd 文件清理后保存为 .md"""
+        md_path = self.output_dir / f"{pdf_path.stem}.md"
+        mmd_path = self.output_dir / f"{pdf_path.stem}.mmd"
+        
+        if mmd_path.exists():
+            # 读取内容
+            content = mmd_path.read_text(encoding='utf-8')
+            
+            # 清理内容（移除多余空行）
+            cleaned_content = self.clean_markdown(content)
+            
+            # 写入 .md 文件
+            md_path.write_text(cleaned_content, encoding='utf-8')
+            
+            # 删除原始 .mmd 文件
+            mmd_path.unlink()
+            
+            print(f"✓ 成功保存到: {md_path}")
+            return True
+        else:
+            print(f"✗ 未找到输出文件")
+            return False
     
     def clean_markdown(self, text: str) -> str:
         """
@@ -167,18 +216,12 @@ class PDFProcessor:
         print(f"找到 {len(pdf_files)} 个 PDF 文件")
         print("="*50)
         
-        # 统计
-        success_count = 0
-        failed_files = []
+        # 所有 PDF 一次交给 nougat, 模型只加载一次
+        results = self.process_pdfs_batch(pdf_files)
         
-        # 处理每个 PDF
-        for idx, pdf_path in enumerate(pdf_files, 1):
-            print(f"\n[{idx}/{len(pdf_files)}]", end=" ")
-            
-            if self.process_single_pdf(pdf_path):
-                success_count += 1
-            else:
-                failed_files.append(pdf_path.name)
+        # 统计
+        success_count = sum(results)
+        failed_files = [pdf_path.name for pdf_path, ok in zip(pdf_files, results) if not ok]
         
         # 最终清理
         self.cleanup_temp_files()
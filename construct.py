@@ -1,18 +1,10 @@
+import sys
 import networkx as nx
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from collections import defaultdict
+from itertools import chain, combinations, islice
 import json
-from uuid import UUID
-
-# Custom JSON encoder for UUID serialization
-class UUIDEncoder(json.JSONEncoder):
-    """
-    A custom JSON encoder to handle UUID objects, converting them to strings.
-    """
-    def default(self, o):
-        if isinstance(o, UUID):
-            return str(o)
-        return super().default(o)
+import orjson
 
 
 # Import your existing classes
@@ -29,6 +21,35 @@ from Edge import (
     EntityToEntityEdge
 )
 
+# 节点类型; 每个节点的属性dict都引用同一个str对象
+_NODE_TYPE_AUTHOR = 'Author'
+_NODE_TYPE_AFFILIATION = 'Affiliation'
+_NODE_TYPE_PAPER = 'Paper'
+_NODE_TYPE_ENTITY = 'Entity'
+
+# 图中每条边只保存 edge_type 和边对象本身; relation/weight 等属性已经在边对象上, 导出时再生成
+_EDGE_TYPE_AUTHOR_PAPER = 'AuthorPaper'
+_EDGE_TYPE_AUTHOR_AFFILIATION = 'AuthorAffiliation'
+_EDGE_TYPE_COAUTHOR = 'Coauthor'
+_EDGE_TYPE_PAPER_AFFILIATION = 'PaperAffiliation'
+_EDGE_TYPE_AFFILIATION_COLLABORATION = 'AffiliationCollaboration'
+_EDGE_TYPE_PAPER_ENTITY = 'PaperEntity'
+_EDGE_TYPE_ENTITY_TO_ENTITY = 'EntityToEntity'
+
+# display_edges 按类名过滤边时使用的类表
+_EDGE_CLASS_REGISTRY = {
+    cls.__name__: cls for cls in (
+        AuthorPaperEdge,
+        AuthorAffiliationEdge,
+        AuthorCoauthorEdge,
+        PaperAffiliationEdge,
+        AffiliationCollaborationEdge,
+        PaperCitationEdge,
+        PaperEntityEdge,
+        EntityToEntityEdge
+    )
+}
+
 class KnowledgeGraphBuilder:
     """
     A class to build and manage a knowledge graph using NetworkX.
@@ -41,7 +62,63 @@ class KnowledgeGraphBuilder:
         self.affiliations: Dict[str, Affiliation] = {}  # Cache for affiliation nodes by name
         self.papers: Dict[str, Paper] = {}  # Cache for paper nodes by title
         self.entities: Dict[str, Entity] = {}  # Cache for entity nodes by name
-        self.edges: List = []  # Store all edge objects
+        self._edges_by_type: Dict[str, List] = defaultdict(list)  # Store all edge objects, 按边的类名分组
+        # 无向关系的边索引: 排序后的端点对 -> 已有的边对象, 查重O(1), 不必扫描MultiDiGraph的平行边
+        # 端点对打包成一个整数 (小ID << 32) | 大ID 作为键, 代替元组: 不分配元组, 只哈希一个int
+        self._coauthor_edge_key: Dict[int, AuthorCoauthorEdge] = {}
+        self._collab_edge_key: Dict[int, AffiliationCollaborationEdge] = {}
+        # 机构名 -> 按创建顺序分配的整数ID, 只用于打包上面的键(作者本身已经是整数ID)
+        self._affiliation_int: Dict[str, int] = {}
+        # 按节点索引边对象, 查询只看与该节点相连的边, 不必扫描全部边
+        self._edges_by_author: Dict[int, List[AuthorCoauthorEdge]] = defaultdict(list)  # 作者ID -> 合作者边
+        self._edges_by_paper: Dict[str, Dict[str, List]] = defaultdict(lambda: defaultdict(list))  # 论文标题 -> edge_type -> 边
+        # 已建立的 (作者ID, 机构名) 关系, 代替对图的 has_edge 查询(边可能还在待写入队列里)
+        self._author_affiliation_pairs: Set[Tuple] = set()
+        # 待写入图的节点和边: 不再逐个 add_node/add_edge, 而是攒起来由 flush() 一次性 add_nodes_from/add_edges_from
+        self._pending_nodes: Dict = {}  # 节点ID -> 属性dict, 保持插入顺序
+        self._pending_edges: List[Tuple] = []  # (u, v, 属性dict)
+        # 按 node_type / edge_type 计数, 随节点和边的写入增量维护, 统计时不必遍历整张图
+        self._node_type_counts: Dict[str, int] = defaultdict(int)
+        self._edge_type_counts: Dict[str, int] = defaultdict(int)
+
+    def _queue_node(self, node_id, **attrs):
+        """登记一个待写入图的节点"""
+        self._pending_nodes[node_id] = attrs
+
+    def _queue_edge(self, u, v, attrs: Dict):
+        """登记一条待写入图的边, attrs 直接作为图中的边属性dict"""
+        self._pending_edges.append((u, v, attrs))
+
+    @property
+    def edges(self) -> Iterator:
+        """所有边对象, 按类型依次迭代(每次访问返回新的迭代器)"""
+        return chain.from_iterable(self._edges_by_type.values())
+
+    def _store_edge(self, edge):
+        """保存一个边对象"""
+        self._edges_by_type[type(edge).__name__].append(edge)
+
+    def _node_attrs(self, node_id) -> Dict:
+        """取节点的属性dict, 无论它是否已经写入图中"""
+        attrs = self._pending_nodes.get(node_id)
+        return attrs if attrs is not None else self.graph.nodes[node_id]
+
+    def flush(self):
+        """
+        把待写入的节点和边一次性写入图中。
+        处理作者列表的构建方法在结束时会自动调用; 实体关系只入队, 逐个实体调用时不必每次都写一次图。
+        读取图的方法在开始时都会先调用一次, 所以待写入的内容总会在被读到之前写入。
+        """
+        if self._pending_nodes:
+            for attrs in self._pending_nodes.values():
+                self._node_type_counts[attrs.get('node_type', 'Unknown')] += 1
+            self.graph.add_nodes_from(self._pending_nodes.items())
+            self._pending_nodes = {}
+        if self._pending_edges:
+            for _, _, attrs in self._pending_edges:
+                self._edge_type_counts[attrs.get('edge_type', 'Unknown')] += 1
+            self.graph.add_edges_from(self._pending_edges)
+            self._pending_edges = []
         
     def get_or_create_author(self, name: str, email: Optional[str] = None) -> Author:
         """
@@ -54,11 +131,13 @@ class KnowledgeGraphBuilder:
         Returns:
             Author node object
         """
+        # 名称同时用作字典键、节点属性和边的显示信息, intern后所有引用共享同一个字符串对象
+        name = sys.intern(name)
         if name not in self.authors:
             author = Author(name=name, email=email)
             self.authors[name] = author
-            self.graph.add_node(author._id, 
-                               node_type='Author',
+            self._queue_node(author._id, 
+                               node_type=_NODE_TYPE_AUTHOR,
                                name=name, 
                                email=email,
                                display_name=name,  # 添加显示名称
@@ -67,7 +146,7 @@ class KnowledgeGraphBuilder:
             # Update email if provided and not already set
             if email and not self.authors[name].Email:
                 self.authors[name].Email = email
-                self.graph.nodes[self.authors[name]._id]['email'] = email
+                self._node_attrs(self.authors[name]._id)['email'] = email
         
         return self.authors[name]
     
@@ -81,11 +160,13 @@ class KnowledgeGraphBuilder:
         Returns:
             Affiliation node object
         """
+        name = sys.intern(name.strip())  # 机构名同时是节点ID, 与 Affiliation.Name 一样去掉首尾空白
         if name not in self.affiliations:
             affiliation = Affiliation(name=name)
             self.affiliations[name] = affiliation
-            self.graph.add_node(name,  # Using name as ID for affiliations
-                               node_type='Affiliation',
+            self._affiliation_int[name] = len(self._affiliation_int)
+            self._queue_node(name,  # Using name as ID for affiliations
+                               node_type=_NODE_TYPE_AFFILIATION,
                                name=name,
                                display_name=name,  # 添加显示名称
                                node_object=affiliation)
@@ -104,8 +185,8 @@ class KnowledgeGraphBuilder:
         """
         if paper.Title not in self.papers:
             self.papers[paper.Title] = paper
-            self.graph.add_node(paper.Title,
-                               node_type='Paper',
+            self._queue_node(paper.Title,
+                               node_type=_NODE_TYPE_PAPER,
                                title=paper.Title,
                                abstract=paper.Abstract,
                                field=paper.field,
@@ -127,11 +208,12 @@ class KnowledgeGraphBuilder:
         Returns:
             Entity node object
         """
+        name = sys.intern(name)
         if name not in self.entities:
             entity = Entity(name=name, field=field, description=description)
             self.entities[name] = entity
-            self.graph.add_node(entity._id,
-                               node_type='Entity',
+            self._queue_node(entity._id,
+                               node_type=_NODE_TYPE_ENTITY,
                                name=name,
                                field=field,
                                description=description,
@@ -147,6 +229,7 @@ class KnowledgeGraphBuilder:
         Returns:
             tuple: (edge_object, edge_key) 如果找到，否则 (None, None)
         """
+        self.flush()
         if not self.graph.has_edge(source_id, target_id):
             return None, None
         
@@ -161,6 +244,7 @@ class KnowledgeGraphBuilder:
         """
         辅助函数：更新图中的边数据
         """
+        self.flush()
         if self.graph.has_edge(source_id, target_id) and edge_key in self.graph[source_id][target_id]:
             for key, value in updates.items():
                 self.graph[source_id][target_id][edge_key][key] = value
@@ -176,36 +260,49 @@ class KnowledgeGraphBuilder:
         Returns:
             Dict[str, float]: 作者名称到权重的映射
         """
-        # 获取所有作者的顺序列表
-        author_orders = []
-        for author in author_list.Authors:
-            # 如果没有 Author_Order，使用默认值 1
-            order = getattr(author, 'Author_Order', 1) or 1
-            author_orders.append(order)
+        # 每个作者的 1/order 只算一次; 如果没有 Author_Order，使用默认值 1
+        inverse_orders = [1 / (author.Author_Order or 1) for author in author_list.Authors]
         
         # 计算 Harmonic Credit Model
         # credit_i = (1/i) / sum(1/k for k in all_orders)
-        sum_harmonic = sum(1/order for order in author_orders)
-        
-        # 创建作者权重映射
-        author_weights = {}
-        for i, author in enumerate(author_list.Authors):
-            order = author_orders[i]
-            weight = round((1/order) / sum_harmonic, 4)  # 保留4位小数
-            author_weights[author.Name] = weight
+        sum_harmonic = sum(inverse_orders)
         
-        return author_weights
+        # 创建作者权重映射, 保留4位小数
+        return {
+            author.Name: round(inverse / sum_harmonic, 4)
+            for author, inverse in zip(author_list.Authors, inverse_orders)
+        }
 
     def process_author_list_and_paper(self, author_list: AuthorList, paper: Paper):
         """
         处理作者列表和论文，创建相关的节点和边
         这是修复了edge_data未绑定问题的版本
         """
+        self._add_author_list_and_paper(author_list, paper)
+        # 本篇论文的节点和边一次性写入图中
+        self.flush()
+
+    def process_papers(self, inputs: List[Tuple[AuthorList, Paper]]):
+        """
+        批量处理多篇论文, 所有节点和边在最后一次性写入图中
+
+        Args:
+            inputs: (作者列表, 论文) 元组的列表
+        """
+        for author_list, paper in inputs:
+            self._add_author_list_and_paper(author_list, paper)
+        self.flush()
+
+    def _add_author_list_and_paper(self, author_list: AuthorList, paper: Paper):
+        """
+        (内部方法) 为一篇论文登记节点和边, 不写入图, 由调用方负责 flush()
+        """
         # Add paper to graph
         paper_node = self.add_paper(paper)
         
-        # Track affiliations for this paper
-        paper_affiliations = set()
+        # Track affiliations for this paper; 按出现顺序保存, 用机构名(即节点ID)去重, 导出结果可复现
+        paper_affiliation_list: List[Affiliation] = []
+        paper_affiliation_names: Set[str] = set()
         
         author_weights = self.calculate_author_credit(author_list, paper_node)
 
@@ -220,7 +317,7 @@ class KnowledgeGraphBuilder:
             author_nodes.append(author_node)
             
             # Create Author-Paper edge
-            author_order = getattr(author_meta, 'Author_Order', 1) or 1
+            author_order = author_meta.Author_Order or 1
             author_paper_edge = AuthorPaperEdge(
                 author=author_node,
                 paper=paper_node,
@@ -230,133 +327,95 @@ class KnowledgeGraphBuilder:
             # 更新权重
             weight = author_weights.get(author_meta.Name, 0.0)
             author_paper_edge.update_weight(weight)
-            self.edges.append(author_paper_edge)
+            self._store_edge(author_paper_edge)
+            self._edges_by_paper[paper_node.Title][_EDGE_TYPE_AUTHOR_PAPER].append(author_paper_edge)
             
-            self.graph.add_edge(
-                author_node._id,
-                paper.Title,
-                relation=author_paper_edge.relation,
-                edge_type='AuthorPaper',
-                author_order=author_order,
-                weight=0.0,
-                edge_object=author_paper_edge,
-                display_info=author_paper_edge.get_simple_display()
-            )
+            self._queue_edge(author_node._id, paper.Title,
+                             {'edge_type': _EDGE_TYPE_AUTHOR_PAPER, 'edge_object': author_paper_edge})
             
             # Process affiliation if exists
-            if hasattr(author_meta, 'Affiliation') and author_meta.Affiliation:
+            if author_meta.Affiliation:
                 affiliation_node = self.get_or_create_affiliation(author_meta.Affiliation)
-                paper_affiliations.add(affiliation_node)
-                
-                # Create Author-Affiliation edge
-                author_affiliation_edge = AuthorAffiliationEdge(
-                    author=author_node,
-                    affiliation=affiliation_node
-                )
-                self.edges.append(author_affiliation_edge)
+                if affiliation_node.Name not in paper_affiliation_names:
+                    paper_affiliation_names.add(affiliation_node.Name)
+                    paper_affiliation_list.append(affiliation_node)
                 
-                # Check if edge already exists before adding
-                if not self.graph.has_edge(author_node._id, affiliation_node.Name):
-                    self.graph.add_edge(
-                        author_node._id,
-                        affiliation_node.Name,
-                        relation=author_affiliation_edge.relation,
-                        edge_type='AuthorAffiliation',
-                        rank=0,
-                        edge_object=author_affiliation_edge,
-                        display_info=author_affiliation_edge.get_simple_display()
+                # Check if edge already exists before adding; 已有的关系不再创建和保存重复的边对象
+                pair = (author_node._id, affiliation_node.Name)
+                if pair not in self._author_affiliation_pairs:
+                    self._author_affiliation_pairs.add(pair)
+                    # Create Author-Affiliation edge
+                    author_affiliation_edge = AuthorAffiliationEdge(
+                        author=author_node,
+                        affiliation=affiliation_node
                     )
+                    self._store_edge(author_affiliation_edge)
+                    self._queue_edge(author_node._id, affiliation_node.Name,
+                                     {'edge_type': _EDGE_TYPE_AUTHOR_AFFILIATION, 'edge_object': author_affiliation_edge})
         
         # Create co-author edges (使用修复的版本)
-        for i in range(len(author_nodes)):
-            for j in range(i + 1, len(author_nodes)):
-                coauthor_edge = AuthorCoauthorEdge(
-                    author1=author_nodes[i],
-                    author2=author_nodes[j],
-                    coauthored_paper=paper_node
-                )
-                self.edges.append(coauthor_edge)
-                
-                source_id = coauthor_edge.source._id
-                target_id = coauthor_edge.target._id
+        # combinations 在C层生成作者对, 代替Python的双重range循环
+        # 单作者论文(很常见)没有作者对, 整段跳过
+        if len(author_nodes) >= 2:
+            for author_i, author_j in combinations(author_nodes, 2):
+                id_i, id_j = author_i._id, author_j._id
+                key = (id_i << 32) | id_j if id_i < id_j else (id_j << 32) | id_i
                 
                 # 查找现有边
-                existing_edge, edge_key = self.find_existing_edge(source_id, target_id, 'Coauthor')
+                existing_edge = self._coauthor_edge_key.get(key)
                 
                 if existing_edge:
-                    # 更新现有边
+                    # 更新现有边; 图中只引用边对象, 不必再写回
                     existing_edge.add_coauthored_paper(paper_node)
-                    # 更新图中的数据
-                    self.update_edge_in_graph(source_id, target_id, edge_key, {
-                        'display_info': existing_edge.get_simple_display(),
-                        'coauthored_papers': existing_edge.attributes.get('coauthored_paper_list', [])
-                    })
                 else:
-                    # 创建新边
-                    self.graph.add_edge(
-                        source_id,
-                        target_id,
-                        relation=coauthor_edge.relation,
-                        edge_type='Coauthor',
-                        weight=0.0,
-                        coauthored_papers=[paper_node],
-                        edge_object=coauthor_edge,
-                        display_info=coauthor_edge.get_simple_display()
+                    # 只有新关系才创建边对象
+                    coauthor_edge = AuthorCoauthorEdge(
+                        author1=author_i,
+                        author2=author_j,
+                        coauthored_paper=paper_node
                     )
+                    self._store_edge(coauthor_edge)
+                    self._edges_by_author[id_i].append(coauthor_edge)
+                    self._edges_by_author[id_j].append(coauthor_edge)
+                    self._coauthor_edge_key[key] = coauthor_edge
+                    self._queue_edge(coauthor_edge.source._id, coauthor_edge.target._id,
+                                     {'edge_type': _EDGE_TYPE_COAUTHOR, 'edge_object': coauthor_edge})
         
         # Create Paper-Affiliation edges
-        for affiliation_node in paper_affiliations:
+        for affiliation_node in paper_affiliation_list:
             paper_affiliation_edge = PaperAffiliationEdge(
                 paper=paper_node,
                 affiliation=affiliation_node
             )
-            self.edges.append(paper_affiliation_edge)
-            self.graph.add_edge(
-                paper.Title,
-                affiliation_node.Name,
-                relation=paper_affiliation_edge.relation,
-                edge_type='PaperAffiliation',
-                edge_object=paper_affiliation_edge,
-                display_info=paper_affiliation_edge.get_simple_display()
-            )
+            self._store_edge(paper_affiliation_edge)
+            self._edges_by_paper[paper_node.Title][_EDGE_TYPE_PAPER_AFFILIATION].append(paper_affiliation_edge)
+            self._queue_edge(paper.Title, affiliation_node.Name,
+                             {'edge_type': _EDGE_TYPE_PAPER_AFFILIATION, 'edge_object': paper_affiliation_edge})
         
         # Create Affiliation collaboration edges (同样需要修复)
-        affiliation_list = list(paper_affiliations)
-        for i in range(len(affiliation_list)):
-            for j in range(i + 1, len(affiliation_list)):
-                collab_edge = AffiliationCollaborationEdge(
-                    affiliation1=affiliation_list[i],
-                    affiliation2=affiliation_list[j],
-                    collaboration_paper=paper_node
-                )
-                self.edges.append(collab_edge)
-                
-                source_name = collab_edge.source.Name
-                target_name = collab_edge.target.Name
+        # 只有一个机构时同样没有合作关系
+        if len(paper_affiliation_list) >= 2:
+            for affiliation_i, affiliation_j in combinations(paper_affiliation_list, 2):
+                id_i, id_j = self._affiliation_int[affiliation_i.Name], self._affiliation_int[affiliation_j.Name]
+                key = (id_i << 32) | id_j if id_i < id_j else (id_j << 32) | id_i
                 
                 # 查找现有边
-                existing_edge, edge_key = self.find_existing_edge(source_name, target_name, 'AffiliationCollaboration')
+                existing_edge = self._collab_edge_key.get(key)
                 
                 if existing_edge:
-                    # 更新现有边
+                    # 更新现有边; 图中只引用边对象, 不必再写回
                     existing_edge.add_collaboration_paper(paper_node)
-                    # 更新图中的数据
-                    self.update_edge_in_graph(source_name, target_name, edge_key, {
-                        'display_info': existing_edge.get_simple_display(),
-                        'collaboration_papers': existing_edge.attributes.get('collaboration_paper_list', [])
-                    })
                 else:
-                    # 创建新边
-                    self.graph.add_edge(
-                        source_name,
-                        target_name,
-                        relation=collab_edge.relation,
-                        edge_type='AffiliationCollaboration',
-                        weight=0.0,
-                        collaboration_papers=[paper_node],
-                        edge_object=collab_edge,
-                        display_info=collab_edge.get_simple_display()
+                    # 只有新关系才创建边对象
+                    collab_edge = AffiliationCollaborationEdge(
+                        affiliation1=affiliation_i,
+                        affiliation2=affiliation_j,
+                        collaboration_paper=paper_node
                     )
+                    self._store_edge(collab_edge)
+                    self._collab_edge_key[key] = collab_edge
+                    self._queue_edge(collab_edge.source.Name, collab_edge.target.Name,
+                                     {'edge_type': _EDGE_TYPE_AFFILIATION_COLLABORATION, 'edge_object': collab_edge})
     
     def add_paper_entity_relation(self, paper: Paper, entity: Entity, weight: float = 0.0):
         """
@@ -380,16 +439,10 @@ class KnowledgeGraphBuilder:
         )
         paper_entity_edge.update_weight(weight)
         
-        self.edges.append(paper_entity_edge)
-        self.graph.add_edge(
-            paper.Title,
-            entity_node._id,
-            relation=paper_entity_edge.relation,
-            edge_type='PaperEntity',
-            weight=weight,
-            edge_object=paper_entity_edge,
-            display_info=paper_entity_edge.get_simple_display()
-        )
+        self._store_edge(paper_entity_edge)
+        self._edges_by_paper[paper_node.Title][_EDGE_TYPE_PAPER_ENTITY].append(paper_entity_edge)
+        self._queue_edge(paper.Title, entity_node._id,
+                         {'edge_type': _EDGE_TYPE_PAPER_ENTITY, 'edge_object': paper_entity_edge})
 
     def combine_entities_by_name(self, source_name: str, target_name: str):
         """
@@ -401,6 +454,7 @@ class KnowledgeGraphBuilder:
             target_name: The name of the entity to merge into and keep.
         """
         print(f"Attempting to combine entity '{source_name}' into '{target_name}'...")
+        self.flush()
 
         # 1. Validate that both entities exist and are different
         if source_name not in self.entities or target_name not in self.entities:
@@ -435,6 +489,7 @@ class KnowledgeGraphBuilder:
         remapped_count = 0
         for u, v, key, data in edges_to_remap:
             self.graph.remove_edge(u, v, key=key)
+            self._edge_type_counts[data.get('edge_type', 'Unknown')] -= 1
             
             new_u = target_id if u == source_id else u
             new_v = target_id if v == source_id else v
@@ -446,12 +501,14 @@ class KnowledgeGraphBuilder:
             # Check if a similar edge already exists to avoid duplicates
             if not self.graph.has_edge(new_u, new_v, key=key):
                 self.graph.add_edge(new_u, new_v, key=key, **data)
+                self._edge_type_counts[data.get('edge_type', 'Unknown')] += 1
                 remapped_count += 1
 
         print(f"Remapped {remapped_count} of {len(edges_to_remap)} original edges.")
 
         # 4. Remove the source node and update caches
         self.graph.remove_node(source_id)
+        self._node_type_counts[_NODE_TYPE_ENTITY] -= 1
         del self.entities[source_name]
 
         print(f"Removed source node '{source_name}'. Combination complete.")
@@ -558,44 +615,38 @@ class KnowledgeGraphBuilder:
         )
         
         # Add the edge to our edge list
-        self.edges.append(edge)
-        
-        # Add the edge to the NetworkX graph
-        self.graph.add_edge(
-            source_node._id,
-            target_node._id,
-            relation=edge.relation,
-            edge_type='EntityToEntity',
-            description=edge.attributes.get('relationship_description', ''),
-            strength=edge.attributes.get('strength', 0.0),
-            edge_object=edge,
-            display_info=edge.get_simple_display()
-        )
+        self._store_edge(edge)
+        
+        # Add the edge to the NetworkX graph (与两个实体节点一起写入)
+        self._queue_edge(source_node._id, target_node._id,
+                         {'edge_type': _EDGE_TYPE_ENTITY_TO_ENTITY, 'edge_object': edge})
     
-    def get_graph_statistics(self) -> Dict:
+    def get_graph_statistics(self, compute_connectivity: bool = False) -> Dict:
         """
         Get basic statistics about the graph.
         
+        Args:
+            compute_connectivity: Whether to compute weak connectivity (O(V+E));
+                when False, 'is_connected' and 'number_of_components' are None.
+        
         Returns:
             Dictionary containing graph statistics
         """
-        node_types = defaultdict(int)
-        edge_types = defaultdict(int)
-        
-        for node, data in self.graph.nodes(data=True):
-            node_types[data.get('node_type', 'Unknown')] += 1
-        
-        for u, v, data in self.graph.edges(data=True):
-            edge_types[data.get('edge_type', 'Unknown')] += 1
-        
-        return {
+        self.flush()
+        # 计数器在写入时增量维护, 这里直接返回, 不再遍历所有节点和边
+        stats = {
             'total_nodes': self.graph.number_of_nodes(),
             'total_edges': self.graph.number_of_edges(),
-            'node_types': dict(node_types),
-            'edge_types': dict(edge_types),
-            'is_connected': nx.is_weakly_connected(self.graph),
-            'number_of_components': nx.number_weakly_connected_components(self.graph)
+            'node_types': {t: c for t, c in self._node_type_counts.items() if c},
+            'edge_types': {t: c for t, c in self._edge_type_counts.items() if c},
+            'is_connected': None,
+            'number_of_components': None
         }
+        # 连通性需要遍历整张图, 只在需要时计算
+        if compute_connectivity and self.graph.number_of_nodes() > 0:
+            stats['is_connected'] = nx.is_weakly_connected(self.graph)
+            stats['number_of_components'] = nx.number_weakly_connected_components(self.graph)
+        return stats
     
     def display_edges(self, limit: int = 10, edge_type: Optional[str] = None) -> List[str]:
         """
@@ -603,26 +654,20 @@ class KnowledgeGraphBuilder:
         
         Args:
             limit: Maximum number of edges to display
-            edge_type: Filter by edge type (optional)
+            edge_type: Filter by edge class name, e.g. 'AuthorPaperEdge' (optional)
             
         Returns:
             List of edge display strings
         """
-        displays = []
-        count = 0
-        
-        for edge in self.edges:
-            if edge_type and not isinstance(edge, eval(edge_type)):
-                continue
-                
-            if count >= limit:
-                break
-                
-            # 使用边对象的友好显示方法
-            displays.append(str(edge))  # 这会调用 __repr__ 方法
-            count += 1
+        edges = self.edges
+        if edge_type:
+            # 边已按类名分组, 只迭代对应的那一组
+            if edge_type not in _EDGE_CLASS_REGISTRY:
+                raise ValueError(f"Unknown edge type: {edge_type}")
+            edges = self._edges_by_type.get(edge_type, ())
         
-        return displays
+        # 使用边对象的友好显示方法; str() 会调用 __repr__ 方法
+        return [str(edge) for edge in islice(edges, max(limit, 0))]
     
     def get_author_collaborators(self, author_name: str) -> List[Dict]:
         """
@@ -640,16 +685,14 @@ class KnowledgeGraphBuilder:
         author = self.authors[author_name]
         collaborators = []
         
-        # 查找所有合作者边
-        for edge in self.edges:
-            if isinstance(edge, AuthorCoauthorEdge):
-                if edge.source == author or edge.target == author:
-                    coauthor = edge.target if edge.source == author else edge.source
-                    collaborators.append({
-                        'name': coauthor.Name,
-                        'papers_count': len(edge.attributes.get('coauthored_paper_list', [])),
-                        'display': edge.get_simple_display()
-                    })
+        # 只看与该作者相连的合作者边
+        for edge in self._edges_by_author.get(author._id, ()):
+            coauthor = edge.target if edge.source == author else edge.source
+            collaborators.append({
+                'name': coauthor.Name,
+                'papers_count': len(edge.coauthored_paper_list),
+                'display': edge.get_simple_display()
+            })
         
         return collaborators
     
@@ -675,36 +718,26 @@ class KnowledgeGraphBuilder:
             'citations': {'citing': [], 'cited_by': []}
         }
         
-        # 遍历所有边来收集信息
-        for edge in self.edges:
-            if isinstance(edge, AuthorPaperEdge) and edge.target == paper:
-                network['authors'].append({
-                    'name': edge.source.Name,
-                    'order': edge.attributes.get('author_order', 0),
-                    'display': edge.get_simple_display()
-                })
-            elif isinstance(edge, PaperAffiliationEdge) and edge.source == paper:
-                network['affiliations'].append({
-                    'name': edge.target.Name,
-                    'display': edge.get_simple_display()
-                })
-            elif isinstance(edge, PaperEntityEdge) and edge.source == paper:
-                network['entities'].append({
-                    'name': edge.target.name,
-                    'weight': edge.attributes.get('weight', 0),
-                    'display': edge.get_simple_display()
-                })
-            elif isinstance(edge, PaperCitationEdge):
-                if edge.source == paper:
-                    network['citations']['citing'].append({
-                        'title': edge.target.Title,
-                        'display': edge.get_simple_display()
-                    })
-                elif edge.target == paper:
-                    network['citations']['cited_by'].append({
-                        'title': edge.source.Title,
-                        'display': edge.get_simple_display()
-                    })
+        # 只看与该论文相连的边, 按边类型分桶
+        # (builder 目前不会创建 PaperCitationEdge, citations 保持为空)
+        paper_edges = self._edges_by_paper.get(paper.Title, {})
+        for edge in paper_edges.get(_EDGE_TYPE_AUTHOR_PAPER, ()):
+            network['authors'].append({
+                'name': edge.source.Name,
+                'order': edge.author_order,
+                'display': edge.get_simple_display()
+            })
+        for edge in paper_edges.get(_EDGE_TYPE_PAPER_AFFILIATION, ()):
+            network['affiliations'].append({
+                'name': edge.target.Name,
+                'display': edge.get_simple_display()
+            })
+        for edge in paper_edges.get(_EDGE_TYPE_PAPER_ENTITY, ()):
+            network['entities'].append({
+                'name': edge.target.name,
+                'weight': edge.weight,
+                'display': edge.get_simple_display()
+            })
         
         # 按作者顺序排序
         network['authors'].sort(key=lambda x: x['order'])
@@ -738,7 +771,7 @@ class KnowledgeGraphBuilder:
         """
         Print a human-readable summary of the graph.
         """
-        stats = self.get_graph_statistics()
+        stats = self.get_graph_statistics(compute_connectivity=True)
         
         print("\n" + "="*50)
         print("Knowledge Graph Summary")
@@ -762,6 +795,31 @@ class KnowledgeGraphBuilder:
         
         print("="*50 + "\n")
     
+    def _export_id(self, node_id) -> str:
+        """(内部方法) 节点在导出文件中的ID: Author/Entity 的整数ID换成带类型前缀的字符串, 以免与标题/名称为数字的论文或机构节点冲突"""
+        if isinstance(node_id, int):
+            return self.graph.nodes[node_id]['node_object'].export_id
+        return node_id
+
+    def _iter_export_nodes(self):
+        """(内部方法) 逐个生成可序列化的节点dict, 去掉 node_object; 节点ID统一转成字符串"""
+        for node, data in self.graph.nodes(data=True):
+            item = {k: v for k, v in data.items() if k != 'node_object'}
+            # Author/Entity node IDs are in-process integers; GraphHandle looks nodes up by string ID
+            item['id'] = self._export_id(node)
+            yield item
+
+    def _iter_export_links(self):
+        """(内部方法) 逐个生成可序列化的边dict, 边的属性从边对象生成; 图中已有的属性(如 update_edge_in_graph 写入的)优先"""
+        for u, v, key, data in self.graph.edges(keys=True, data=True):
+            edge_object = data.get('edge_object')
+            item = edge_object.graph_attributes() if edge_object is not None else {}
+            item.update((k, val) for k, val in data.items() if k != 'edge_object')
+            item['source'] = self._export_id(u)
+            item['target'] = self._export_id(v)
+            item['key'] = key
+            yield item
+
     def export_to_json(self, filename: str):
         """
         Export the graph to a JSON file in node-link format.
@@ -769,35 +827,24 @@ class KnowledgeGraphBuilder:
         Args:
             filename: Output filename (should end with .json)
         """
-        # Create a copy of the graph for export to avoid modifying the original
-        export_graph = self.graph.copy()
-        
-        # Prepare nodes for serialization
-        for node, data in export_graph.nodes(data=True):
-            if 'node_object' in data:
-                del data['node_object']
-            
-        # Prepare edges for serialization
-        for u, v, key, data in export_graph.edges(keys=True, data=True):
-            if 'edge_object' in data:
-                del data['edge_object']
-            
-            # Convert Paper objects in lists to string titles
-            for paper_list_key in ['coauthored_papers', 'collaboration_papers', 'coauthored_paper_list', 'collaboration_paper_list']:
-                if paper_list_key in data and data[paper_list_key]:
-                    # Check if the list contains Paper objects
-                    if hasattr(data[paper_list_key][0], 'Title'):
-                        data[paper_list_key] = [p.Title for p in data[paper_list_key]]
-
-        # Generate data in a format suitable for JSON (node-link format)
-        graph_data = nx.node_link_data(export_graph)
+        self.flush()
         
         # Ensure the filename has a .json extension
         if not filename.endswith('.json'):
             filename += '.json'
             
-        # Write the data to a JSON file
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(graph_data, f, ensure_ascii=False, indent=4, cls=UUIDEncoder)
+        # 逐个节点/边序列化后直接写入文件, 不复制图, 也不在内存里构建完整的 node-link dict;
+        # 结构与 nx.node_link_data 相同, 边固定放在 "links" 下(GraphHandle 读取这个键)
+        with open(filename, 'wb') as f:
+            f.write(b'{"directed": ' + orjson.dumps(self.graph.is_directed()))
+            f.write(b', "multigraph": ' + orjson.dumps(self.graph.is_multigraph()))
+            f.write(b', "graph": ' + orjson.dumps(self.graph.graph))
+            for section, items in ((b'nodes', self._iter_export_nodes()), (b'links', self._iter_export_links())):
+                f.write(b', "' + section + b'": [')
+                for i, item in enumerate(items):
+                    f.write(b'\n' if i == 0 else b',\n')
+                    f.write(orjson.dumps(item))
+                f.write(b'\n]')
+            f.write(b'}\n')
             
-        print(f"Graph exported to {filename}")
\ No newline at end of file
+        print(f"Graph exported to {filename}")
@@ -1,10 +1,17 @@
-from openai import OpenAI, APIError
+import asyncio
+import hashlib
+import json
+import time
+from openai import OpenAI, AsyncOpenAI, APIError
 from graph_handle import GraphHandle
 import numpy as np
 import pandas as pd
 import os
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import Literal
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Literal, Optional
 class EmbeddingClient:
     """
     一个用于获取实体嵌入向量的客户端。
@@ -12,68 +19,369 @@ class EmbeddingClient:
     该客户端负责与OpenAI API交互，为知识图谱中的实体生成嵌入向量，
     并使用缓存机制来避免不必要的API调用。
     """
-    def __init__(self, api_key: str, base_url: str, model: str, cache_file: str = "embedding_data.pkl", graph_file: str = "knowledge_graph.json"):
+    def __init__(self, api_key: str, base_url: str, model: str, cache_file: str = "embedding_data.npy", graph_file: str = "knowledge_graph.json",
+                 batch_size: int = 256, concurrency: int = 16, max_retries: int = 5, query_cache_size: int = 1024):
         """
         初始化EmbeddingClient。
 
         :param api_key: OpenAI API密钥。
         :param base_url: OpenAI API的基础URL。
         :param model: 用于生成嵌入的模型的名称。
-        :param cache_file: 用于存储和加载嵌入向量缓存的文件路径。
+        :param cache_file: 用于存储和加载嵌入矩阵的 .npy 文件路径 (float16 的二维矩阵); ids 和每行描述的哈希分别存在同目录的 "<文件名>_ids.npy" / "<文件名>_hashes.npy" 中。
         :param graph_file: 知识图谱数据的文件路径。
+        :param batch_size: 生成全部实体嵌入时每个请求包含的文本数。
+        :param concurrency: 生成全部实体嵌入时同时进行的请求数上限。
+        :param max_retries: 异步请求遇到 429/5xx 等错误时的重试次数 (由 openai SDK 按指数退避重试)。
+        :param query_cache_size: get_embedding 缓存的查询嵌入条数上限 (LRU), 为0时不缓存。
         """
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        # 客户端和图数据都在第一次使用时才创建/加载, 命中缓存时不必付出这些开销
+        self.api_key = api_key
+        self.base_url = base_url
+        self.graph_file = graph_file
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.max_retries = max_retries
         self.model = model
-        self.graph_handle = GraphHandle(graph_file)
         self.cache_file = cache_file
+        self.ids_file = os.path.splitext(cache_file)[0] + '_ids.npy'
+        self.hashes_file = os.path.splitext(cache_file)[0] + '_hashes.npy'
+        # 嵌入向量按行存成一个连续的二维矩阵, 与 ids 一一对应
+        self._ids: np.ndarray = np.empty(0, dtype=str)
+        self._matrix: np.ndarray = np.empty((0, 0), dtype=np.float16)
+        # 每行对应实体描述的哈希, 用于增量更新; 旧版缓存没有记录时为 None
+        self._hashes: Optional[np.ndarray] = None
+        # top_n_similarity 用的 (DataFrame, 按行L2归一化的float32矩阵, ids), 同一个 DataFrame 只归一化一次
+        self._similarity_cache: Optional[tuple[pd.DataFrame, np.ndarray, np.ndarray]] = None
+        # 查询文本 -> 嵌入向量, 同一会话中重复的查询不再请求API
+        self.query_cache_size = max(0, query_cache_size)
+        self._query_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
+    def _set_embeddings(self, ids, matrix: np.ndarray, hashes=None):
+        """(内部方法) 设置 ids、嵌入矩阵和描述哈希; 矩阵存为 float16, 内存和磁盘占用都是 float32 的一半。"""
+        self._ids = np.asarray(ids, dtype=str)
+        matrix = np.ascontiguousarray(matrix, dtype=np.float16)
+        # 没有任何实体时 matrix 是空数组, reshape(0, -1) 无法推断列数, 需要显式给出
+        cols = matrix.shape[1] if matrix.ndim == 2 else (-1 if matrix.size else 0)
+        self._matrix = matrix.reshape(len(self._ids), cols)
+        self._hashes = np.asarray(hashes, dtype=str) if hashes is not None else None
+
+    def _save_cache(self):
+        """(内部方法) 把嵌入矩阵、ids 和描述哈希分别写入 .npy 文件, 不用 pickle。"""
+        files = [(self.cache_file, self._matrix), (self.ids_file, self._ids)]
+        if self._hashes is not None:
+            files.append((self.hashes_file, self._hashes))
+        for path, array in files:
+            # 先写临时文件再替换: 旧缓存可能仍被内存映射着, 不能原地截断;
+            # 传文件对象, 避免 np.save 自动给文件名追加 .npy
+            with open(path + '.tmp', 'wb') as f:
+                np.save(f, array)
+            os.replace(path + '.tmp', path)
+
+    def _load_npy_cache(self):
+        """(内部方法) 加载 .npy 缓存; 嵌入矩阵以只读内存映射打开, 不把整个文件读进内存。"""
+        self._matrix = np.load(self.cache_file, mmap_mode='r')
+        self._ids = np.load(self.ids_file, allow_pickle=False)
+        self._hashes = np.load(self.hashes_file, allow_pickle=False) if os.path.exists(self.hashes_file) else None
+
+    def _load_cache(self, path: str):
+        """(内部方法) 从旧版缓存文件加载 ids 和嵌入矩阵, 并转换为 .npy 格式写入 self.cache_file。"""
+        if zipfile.is_zipfile(path):
+            # 旧版缓存: npz, ids 和 embeddings 存在同一个文件里
+            with np.load(path, allow_pickle=False) as data:
+                self._set_embeddings(data['ids'], data['embeddings'])
+        else:
+            # 更早的缓存: pickle 的 DataFrame, 每一行的 embedding 是单独的 numpy 数组
+            df = pd.read_pickle(path)
+            self._set_embeddings(df['id'].tolist(), np.vstack(df['embedding'].values) if len(df) else np.empty((0, 0))) # type: ignore
+        self._save_cache()
+
+    def _embeddings_dataframe(self) -> pd.DataFrame:
+        """(内部方法) 以 DataFrame 形式返回嵌入, 每行的 embedding 是矩阵行的视图, 不复制数据。"""
+        df = pd.DataFrame({'id': self._ids.tolist(), 'embedding': list(self._matrix)})
+        # 直接用已有的矩阵预先算好归一化结果, 查询时不必再从 DataFrame 拼矩阵
+        self._similarity_cache = (df, self._normalize_rows(self._matrix), self._ids)
+        return df
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """(内部方法) 返回按行L2归一化后的 float32 矩阵; 零向量保持为零。"""
+        normed = np.array(matrix, dtype=np.float32, order='C')
+        if normed.size:
+            norms = np.linalg.norm(normed, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            normed /= norms
+        return normed
 
     def embedding_all_entities(self):
         """
         为图中的所有'Entity'类型的节点生成或加载嵌入向量。
 
-        该方法首先检查是否存在缓存文件。如果存在，则直接从文件加载嵌入数据。
-        如果不存在，它会从图中获取所有实体，分批为它们生成嵌入向量，
-        然后将结果保存到缓存文件并返回。
+        该方法首先加载已有的缓存文件(如果存在)，再与图中的实体比对:
+        描述没有变化的实体直接复用缓存中的嵌入，只为新增或描述有变化的实体
+        分批生成嵌入向量，然后将合并后的结果保存到缓存文件并返回。
 
         :return: 一个包含实体'id'和'embedding'的pandas DataFrame。
         """
-        # 检查是否存在缓存文件，如果存在则直接加载
-        if os.path.exists(self.cache_file):
-            print(f"Loading embeddings from cached file: {self.cache_file}")
-            with open(self.cache_file, 'rb') as f:
-                df = pd.read_pickle(f)
-            return df
-        
-        # 如果没有缓存，则从图中获取所有实体
-        entities = self.graph_handle.node_types('Entity')
-        rows_list = []
-        batch_size = 10  # 设置批量处理的大小，以提高API调用效率
-
-        # 分批处理实体
-        for i in range(0, len(entities), batch_size):
-            batch = entities[i:i + batch_size]
-            # 提取每个实体的描述，如果描述不存在则使用空字符串
-            descriptions = [entity.get('description', '') for entity in batch]
-            ids = [entity.get('id', '') for entity in batch]
-            
-            # 为当前批次的描述生成嵌入向量
-            embeddings = self.get_embedding(descriptions)
-            
-            # 将id和对应的embedding组织起来
-            for j, id in enumerate(ids):
-                # 确保id和描述都存在
-                if id and descriptions[j]:
-                    row = {'id': id, 'embedding': embeddings[j]}
-                    rows_list.append(row)
-        
-        # 将结果转换为DataFrame
-        df = pd.DataFrame(rows_list)
-        
-        # 将DataFrame保存到pickle文件作为缓存
-        with open(self.cache_file, 'wb') as f:
-            df.to_pickle(self.cache_file)
-        return df
+        return self._build_embeddings(self._embed_texts)
     
+    def embedding_all_entities_batch(self, poll_interval: float = 60.0, input_file: str = "embedding_batch_input.jsonl"):
+        """
+        与 embedding_all_entities 相同, 但通过 OpenAI Batch API 离线生成嵌入向量。
+
+        适合一次性构建缓存: 费用约为实时请求的一半, 也不受实时接口的速率限制,
+        但结果可能需要数小时(最长24小时)才能返回, 期间该方法会阻塞轮询。
+        查询时的 get_embedding 仍然使用实时接口。
+
+        :param poll_interval: 轮询批处理任务状态的间隔(秒)。
+        :param input_file: 写入批处理请求的 JSONL 文件路径。
+        :return: 一个包含实体'id'和'embedding'的pandas DataFrame。
+        :raises RuntimeError: 如果批处理任务失败、过期或被取消，或有请求没有返回结果。
+        """
+        return self._build_embeddings(lambda texts: self._embed_texts_batch(texts, poll_interval, input_file))
+
+    def _build_embeddings(self, embed) -> pd.DataFrame:
+        """
+        (内部方法) 增量地构建全部实体的嵌入: 按描述哈希复用缓存, 只嵌入新增或变化的描述。
+
+        :param embed: 接收文本列表、返回对应 float32 二维矩阵的函数。
+        :return: 一个包含实体'id'和'embedding'的pandas DataFrame。
+        """
+        cached = self._try_load_cache()
+        # 没有图文件时无法比对, 直接使用已有缓存
+        if cached and not os.path.exists(self.graph_file):
+            return self._embeddings_dataframe()
+
+        kept_ids, unique_descriptions, row_of = self._collect_entity_descriptions()
+        unique_hashes = [self._description_hash(description) for description in unique_descriptions]
+        row_hashes = [unique_hashes[j] for j in row_of]
+        # 缓存与图中的实体完全一致, 不必重写
+        if cached and self._hashes is not None and self._ids.tolist() == kept_ids and self._hashes.tolist() == row_hashes:
+            return self._embeddings_dataframe()
+
+        reusable = self._reusable_rows(kept_ids, row_of, unique_hashes) if cached else {}
+        missing = [j for j, h in enumerate(unique_hashes) if h not in reusable]
+        print(f"Embedding {len(missing)} new or changed descriptions, reusing {len(unique_hashes) - len(missing)} from cache.")
+        new_embeddings = embed([unique_descriptions[j] for j in missing]) if missing else None
+        reused = [j for j, h in enumerate(unique_hashes) if h in reusable]
+
+        # 旧版缓存按id复用, 没有记录模型; 维度与新生成的嵌入不同说明缓存来自别的模型, 这些行也要重新嵌入
+        if reused and new_embeddings is not None and new_embeddings.shape[1] != self._matrix.shape[1]:
+            print(f"Cached embeddings have dimension {self._matrix.shape[1]} but the model returns {new_embeddings.shape[1]}; re-embedding the cached descriptions too.")
+            new_embeddings = np.vstack([new_embeddings, embed([unique_descriptions[j] for j in reused])])
+            missing, reused = missing + reused, []
+
+        # 按唯一描述组装矩阵: 可复用的行从缓存拷贝, 其余填入新生成的嵌入
+        dim = new_embeddings.shape[1] if new_embeddings is not None else self._matrix.shape[1]
+        unique_matrix = np.empty((len(unique_descriptions), dim), dtype=np.float32)
+        if reused:
+            unique_matrix[reused] = self._matrix[[reusable[unique_hashes[j]] for j in reused]]
+        if missing:
+            unique_matrix[missing] = new_embeddings
+
+        # 按下标把唯一描述的嵌入展开回每个实体并保存到缓存文件
+        self._set_embeddings(kept_ids, unique_matrix[row_of], row_hashes)
+        self._save_cache()
+        return self._embeddings_dataframe()
+
+    def _reusable_rows(self, kept_ids: list[str], row_of: list[int], unique_hashes: list[str]) -> dict[str, int]:
+        """
+        (内部方法) 返回已加载缓存中可复用的嵌入: 描述哈希 -> 缓存矩阵的行号。
+
+        旧版缓存没有记录描述哈希, 此时按实体id对应, 视为描述没有变化(与之前直接使用缓存的行为一致)。
+        """
+        if self._hashes is not None:
+            return {h: i for i, h in enumerate(self._hashes.tolist())}
+        row_by_id = {id: i for i, id in enumerate(self._ids.tolist())}
+        reusable = {}
+        for id, j in zip(kept_ids, row_of):
+            i = row_by_id.get(id)
+            if i is not None:
+                reusable.setdefault(unique_hashes[j], i)
+        return reusable
+
+    def _description_hash(self, description: str) -> str:
+        """(内部方法) 实体描述连同模型名的哈希, 描述或模型变化时哈希都会变化, 缓存的嵌入不会被复用。"""
+        return hashlib.blake2b(self.model.encode('utf-8') + b'\0' + description.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _embed_texts(self, texts: list[str]) -> np.ndarray:
+        """(内部方法) 通过实时接口分批并发地为文本生成嵌入, 返回 float32 二维矩阵。"""
+        # 分批并发请求, 以提高API调用效率
+        batches = [texts[i:i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        embeddings = self._run_async(self._embed_all_async(batches))
+        return np.vstack(embeddings) if embeddings else np.empty((0, 0), dtype=np.float32)
+
+    @staticmethod
+    def _run_async(coro):
+        """(内部方法) 在新的事件循环中运行协程; 如果当前线程已有运行中的循环(如 notebook), 则放到工作线程中运行。"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    def _embed_texts_batch(self, texts: list[str], poll_interval: float, input_file: str) -> np.ndarray:
+        """(内部方法) 通过 Batch API 为文本生成嵌入, 返回 float32 二维矩阵; 失败时抛出 RuntimeError。"""
+        # 每个唯一描述一条请求, custom_id 用描述的下标
+        with open(input_file, 'w', encoding='utf-8') as f:
+            for i, description in enumerate(texts):
+                request = {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/embeddings",
+                    "body": {"model": self.model, "input": description}
+                }
+                f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+        with open(input_file, 'rb') as f:
+            batch_input = self.client.files.create(file=f, purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/embeddings",
+            completion_window="24h"
+        )
+        print(f"Submitted embedding batch {batch.id} with {len(texts)} requests.")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+            print(f"Embedding batch {batch.id} status: {batch.status}")
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Embedding batch {batch.id} ended with status '{batch.status}'")
+
+        # 结果文件的行顺序不保证与请求一致, 按 custom_id 放回对应的行
+        matrix = None
+        received = 0
+        for line in self.client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            response = result.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            embedding = response["body"]["data"][0]["embedding"]
+            if matrix is None:
+                matrix = np.empty((len(texts), len(embedding)), dtype=np.float32)
+            matrix[int(result["custom_id"])] = embedding
+            received += 1
+        if matrix is None or received != len(texts):
+            raise RuntimeError(f"Embedding batch {batch.id} returned {received} of {len(texts)} embeddings")
+
+        return matrix
+
+    def _try_load_cache(self) -> bool:
+        """(内部方法) 如果缓存文件存在就加载它并返回 True; 也兼容同名的旧版 .npz / .pkl 缓存。"""
+        if os.path.exists(self.cache_file) and os.path.exists(self.ids_file):
+            print(f"Loading embeddings from cached file: {self.cache_file}")
+            self._load_npy_cache()
+            return True
+        stem = os.path.splitext(self.cache_file)[0]
+        for path in (stem + '.npz', stem + '.pkl'):
+            if os.path.exists(path):
+                print(f"Loading embeddings from cached file: {path}")
+                self._load_cache(path)
+                return True
+        return False
+
+    def _collect_entity_descriptions(self) -> tuple[list[str], list[str], list[int]]:
+        """
+        (内部方法) 从图中收集需要嵌入的实体。
+
+        :return: (实体id列表, 去重后的描述列表, 每个实体对应的唯一描述下标)
+        """
+        kept_ids = []
+        descriptions = []
+        for entity in self.graph_handle.node_types('Entity'):
+            # 只嵌入id和描述都存在的实体
+            id, description = entity.get('id', ''), entity.get('description', '')
+            if id and description:
+                kept_ids.append(id)
+                descriptions.append(description)
+
+        # 描述相同的实体只嵌入一次: 记录每个实体对应的唯一描述下标
+        unique_index = {}
+        row_of = [unique_index.setdefault(description, len(unique_index)) for description in descriptions]
+        return kept_ids, list(unique_index), row_of
+
+    @cached_property
+    def client(self) -> OpenAI:
+        """同步客户端, 第一次使用时才创建。"""
+        return OpenAI(api_key=self.api_key, base_url=self.base_url)
+
+    def _new_async_client(self) -> AsyncOpenAI:
+        """
+        (内部方法) 创建一个新的异步客户端。
+
+        异步客户端的连接池绑定在创建它的事件循环上, 所以不缓存在实例上,
+        而是在每个事件循环里用 async with 创建并关闭。
+        """
+        return AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=self.max_retries)
+
+    @cached_property
+    def graph_handle(self) -> GraphHandle:
+        """知识图谱数据, 第一次使用时才从 graph_file 加载。"""
+        return GraphHandle(self.graph_file)
+
+    async def _embed_all_async(self, batches: list[list[str]]) -> list[np.ndarray]:
+        """
+        并发地为多批文本生成嵌入向量, 同时进行的请求数不超过 self.concurrency。
+
+        :param batches: 文本批次的列表。
+        :return: 与 batches 一一对应的二维数组列表。
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with self._new_async_client() as client:
+            async def _bounded(batch: list[str]) -> np.ndarray:
+                async with semaphore:
+                    return await self._aembed(client, batch)
+
+            return list(await asyncio.gather(*(_bounded(batch) for batch in batches)))
+
+    async def aget_embedding(self, input_text: str|list, text_type: Literal['query', 'document']='document') -> np.ndarray:
+        """
+        get_embedding 的异步版本。
+
+        :param input_text: 单个字符串或字符串列表。
+        :param text_type: 文本类型，必须是 'query' 或 'document'
+        :return: 单个numpy数组或由多个numpy数组垂直堆叠的二维数组。
+        :raises APIError: 如果OpenAI API调用失败 (已按 max_retries 重试)。
+        """
+        async with self._new_async_client() as client:
+            return await self._aembed(client, input_text, text_type)
+
+    async def _aembed(self, client: AsyncOpenAI, input_text: str|list, text_type: str = 'document') -> np.ndarray:
+        """(内部方法) 用给定的异步客户端为文本生成嵌入向量。"""
+        input_text = self._prepare_input(input_text, text_type)
+        try:
+            response = await client.embeddings.create(
+                input=input_text,
+                model=self.model
+            )
+        except APIError as e:
+            print(f"An OpenAI API error occurred: {e}")
+            raise
+        return self._response_to_array(response, input_text)
+
+    def _prepare_input(self, input_text: str|list, text_type: str) -> str|list:
+        """(内部方法) 校验 text_type, 并给查询文本加上查询提示。"""
+        if text_type not in ['query', 'document']:
+            raise ValueError("text_type must be either 'query' or 'document'")
+        if text_type == 'query':
+            input_text = f"This is a query request, you'll given a research paper query, you should try to retrive most relevant documents. This is the query: {input_text}"
+        return input_text
+
+    def _response_to_array(self, response, input_text: str|list) -> np.ndarray:
+        """(内部方法) 根据输入是单个文本还是列表，返回相应格式的numpy数组。"""
+        if isinstance(input_text, str):
+            return np.array(response.data[0].embedding, dtype=np.float32)
+        # 一次性分配整块结果矩阵再逐行填入, 不必像 np.vstack 那样先为每一行单独建数组再拼接
+        data = response.data
+        out = np.empty((len(data), len(data[0].embedding) if data else 0), dtype=np.float32)
+        for i, item in enumerate(data):
+            out[i] = item.embedding
+        return out
+
     def get_embedding(self, input_text: str|list, text_type: Literal['query', 'document']='document') -> np.ndarray:
         """
         调用OpenAI API为单个文本或文本列表生成嵌入向量。
@@ -84,21 +392,21 @@ class EmbeddingClient:
         :raises APIError: 如果OpenAI API调用失败。
         :raises Exception: 如果发生其他预期之外的错误。
         """
-        if text_type not in ['query', 'document']:
-            raise ValueError("text_type must be either 'query' or 'document'")
+        # 单条查询先查LRU缓存; 返回副本, 调用方修改结果不会污染缓存
+        cache_key = input_text if text_type == 'query' and isinstance(input_text, str) and self.query_cache_size else None
+        if cache_key is not None and cache_key in self._query_cache:
+            self._query_cache.move_to_end(cache_key)
+            return self._query_cache[cache_key].copy()
+
+        input_text = self._prepare_input(input_text, text_type)
         try:
-            if text_type == 'query':
-                input_text = f"This is a query request, you'll given a research paper query, you should try to retrive most relevant documents. This is the query: {input_text}"
             # 调用OpenAI的embeddings API
             response = self.client.embeddings.create(
                 input=input_text,
                 model=self.model
             )
             # 根据输入是单个文本还是列表，返回相应格式的numpy数组
-            if isinstance(input_text, str):
-                return np.array(response.data[0].embedding)
-            else:
-                return np.vstack([response.data[i].embedding for i in range(len(response.data))])
+            embedding = self._response_to_array(response, input_text)
         except APIError as e:
             # 捕获并处理OpenAI API特定的错误
             print(f"An OpenAI API error occurred: {e}")
@@ -110,6 +418,12 @@ class EmbeddingClient:
             # 同样重新抛出异常
             raise
 
+        if cache_key is not None:
+            self._query_cache[cache_key] = embedding.copy()
+            if len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return embedding
+
     def top_n_similarity(self, df: pd.DataFrame, query_embedding: np.ndarray, n: int = 5) -> dict:
         """
         在 DataFrame 中查找与 query_embedding 余弦相似度最高的 n 行，并返回其 ID。
@@ -122,16 +436,28 @@ class EmbeddingClient:
         Returns:
             dict: {id: similarity_score} 的字典
         """
-        embedding_matrix = np.vstack(df['embedding'].values) # type: ignore
-    
-        query_vec = query_embedding.reshape(1, -1)
-        similarities = cosine_similarity(embedding_matrix, query_vec).flatten()
+        # 语料矩阵及其行范数在多次查询间不变: 同一个 DataFrame 只归一化一次并缓存
+        if self._similarity_cache is None or self._similarity_cache[0] is not df:
+            matrix = np.vstack(df['embedding'].values) if len(df) else np.empty((0, 0)) # type: ignore
+            self._similarity_cache = (df, self._normalize_rows(matrix), df['id'].to_numpy())
+        _, normed_matrix, ids = self._similarity_cache
+
+        n = min(n, len(ids))
+        if n <= 0:
+            return {}
+
+        # 余弦相似度 = 归一化矩阵与归一化查询向量的点积, 一次矩阵-向量乘法
+        query_vec = np.asarray(query_embedding, dtype=np.float32).ravel()
+        query_norm = np.linalg.norm(query_vec)
+        if query_norm > 0:
+            query_vec = query_vec / query_norm
+        similarities = normed_matrix @ query_vec
 
-        if n > len(df):
-            n = len(df)
-        top_indices = np.argsort(similarities)[-n:][::-1]
+        # argpartition 先O(N)选出前n个, 只对这n个排序
+        top_indices = np.argpartition(similarities, -n)[-n:]
+        top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
 
-        top_ids = df.iloc[top_indices]['id'].tolist()
+        top_ids = ids[top_indices].tolist()
         top_scores = similarities[top_indices]
     
         return dict(zip(top_ids, top_scores))
\ No newline at end of file
@@ -5,6 +5,7 @@ Paper Entity Extractor — 同步版本 (synchronous)
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
 import networkx as nx
@@ -51,7 +52,8 @@ class PaperEntityExtractor:
         # tuple_delimiter: str = "<|>",
         record_delimiter: str = "##",
         max_tokens: int = 4000,
-        temperature: float = 0.1
+        temperature: float = 0.1,
+        max_retries: int = 5
     ):
         self.llm_provider = llm_provider
         self.model = model
@@ -60,16 +62,16 @@ class PaperEntityExtractor:
         self.max_tokens = max_tokens
         self.temperature = temperature
 
-        # 初始化同步 LLM 客户端（OpenAI）
+        # 初始化同步 LLM 客户端（OpenAI）; 遇到 429/5xx 时由 SDK 按指数退避重试 max_retries 次
         if llm_provider == "openai":
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, max_retries=max_retries)
             self.model = "gpt-4o-mini"
         elif llm_provider == "deepseek":
             # deepseek 通过 base_url 指定
-            self.client = OpenAI(api_key=api_key, base_url=api_base_url)
+            self.client = OpenAI(api_key=api_key, base_url=api_base_url, max_retries=max_retries)
             self.model = "deepseek-chat"
         elif llm_provider == "ollama":
-            self.client = OpenAI(api_key="ollama", base_url=api_base_url)
+            self.client = OpenAI(api_key="ollama", base_url=api_base_url, max_retries=max_retries)
         else:
             raise ValueError(f"Unsupported LLM provider: {llm_provider}")
 
@@ -262,6 +264,17 @@ class PaperEntityExtractor:
         
         return entities, relations
 
+    def extract_entities_batch(self, papers: List[Paper], max_concurrency: int = 8) -> List[tuple[List[Entity], List[EntityToEntityEdge]]]:
+        """
+        并发地从多篇论文摘要提取实体和关系, 同时进行的请求数不超过 max_concurrency。
+        LLM 请求是I/O密集的, 用线程池即可让多个请求的等待时间重叠; 返回结果与 papers 一一对应。
+        """
+        if not papers:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(papers)))) as executor:
+            # extract_entities_from_abstract 自己处理请求错误(返回空结果), 单篇失败不影响其他论文
+            return list(executor.map(self.extract_entities_from_abstract, papers))
+
     def _parse_extraction_response(self, response: Union[str, dict]) -> tuple[List[Entity], List[EntityToEntityEdge]]:
         entities: List[Entity] = []
         relations: List[EntityToEntityEdge] = []
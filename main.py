@@ -153,6 +153,8 @@ class PaperProcessor:
             
             # 创建Paper对象
             paper = Paper(title=title, abstract=abstract, field=field)
+            # 缓存读写也用规范化后的标题, 与 CachedEntityExtractor 使用的 paper.Title 一致
+            title = paper.Title
             
             # 检查缓存状态
             logger.info(f"缓存状态 - 作者: {self.cache.has_author_metadata(title)}, "
@@ -161,7 +163,9 @@ class PaperProcessor:
             # 提取作者信息（使用缓存）
             content = parser.get_content(title="", level=1)
             if content:
-                meta_data = content.split(abstract)[0].strip()
+                # 只需要摘要之前的部分, 用find切片, 不必让split把摘要之后的全文再拷贝一份
+                abstract_pos = content.find(abstract)
+                meta_data = (content[:abstract_pos] if abstract_pos >= 0 else content).strip()
                 author_result = self.author_extractor.get_authors(title, meta_data)
                 
                 if isinstance(author_result, AuthorList):
@@ -226,7 +230,8 @@ class PaperProcessor:
             logger.info(f"  {key}: {value}")
         
         # 6. 显示知识图谱统计
-        kg_stats = self.kg_builder.get_graph_statistics()
+        # 这里要打印连通性, 与 print_graph_summary 一样显式计算 (一次 O(V+E) 遍历)
+        kg_stats = self.kg_builder.get_graph_statistics(compute_connectivity=True)
         logger.info("\n知识图谱统计:")
         for key, value in kg_stats.items():
             logger.info(f"  {key}: {value}")